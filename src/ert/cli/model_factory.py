@@ -3,8 +3,6 @@
 import logging
 from typing import TYPE_CHECKING, Tuple
 
-import numpy as np
-
 from ert.analysis._es_update import UpdateSettings
 from ert.cli import (
     ENSEMBLE_EXPERIMENT_MODE,
@@ -37,19 +35,17 @@
 if TYPE_CHECKING:
     from typing import List
 
-    import numpy.typing as npt
-
     from ert.config import Workflow
     from ert.namespace import Namespace
     from ert.storage import StorageAccessor
 
 
 def _misfit_preprocessor(workflows: List[Workflow]) -> bool:
-    for workflow in workflows:
-        for job, _ in workflow:
-            if job.name == "MISFIT_PREPROCESSOR":
-                return True
-    return False
+    return any(
+        job.name == "MISFIT_PREPROCESSOR"
+        for workflow in workflows
+        for job, _ in workflow
+    )
 
 
 def create_model(
@@ -115,8 +111,10 @@ def _setup_ensemble_experiment(
     config: ErtConfig, storage: StorageAccessor, args: Namespace
 ) -> EnsembleExperiment:
     min_realizations_count = config.analysis_config.minimum_required_realizations
-    active_realizations = _realizations(args, config.model_config.num_realizations)
-    active_realizations_count = int(np.sum(active_realizations))
+    active_realizations = _active_realizations(
+        args, config.model_config.num_realizations
+    )
+    active_realizations_count = active_realizations.count(True)
     if active_realizations_count < min_realizations_count:
         config.analysis_config.minimum_required_realizations = active_realizations_count
         ConfigWarning.ert_context_warn(
@@ -129,7 +127,7 @@ def _setup_ensemble_experiment(
     return EnsembleExperiment(
         EnsembleExperimentRunArguments(
             random_seed=config.random_seed,
-            active_realizations=active_realizations.tolist(),
+            active_realizations=active_realizations,
             current_case=args.current_case,
             iter_num=int(args.iter_num),
             minimum_required_realizations=config.analysis_config.minimum_required_realizations,
@@ -147,8 +145,10 @@ def _setup_evaluate_ensemble(
     config: ErtConfig, storage: StorageAccessor, args: Namespace
 ) -> EvaluateEnsemble:
     min_realizations_count = config.analysis_config.minimum_required_realizations
-    active_realizations = _realizations(args, config.model_config.num_realizations)
-    active_realizations_count = int(np.sum(active_realizations))
+    active_realizations = _active_realizations(
+        args, config.model_config.num_realizations
+    )
+    active_realizations_count = active_realizations.count(True)
     if active_realizations_count < min_realizations_count:
         config.analysis_config.minimum_required_realizations = active_realizations_count
         ConfigWarning.ert_context_warn(
@@ -160,7 +160,7 @@ def _setup_evaluate_ensemble(
     return EvaluateEnsemble(
         EvaluateEnsembleRunArguments(
             random_seed=config.random_seed,
-            active_realizations=active_realizations.tolist(),
+            active_realizations=active_realizations,
             current_case=args.ensemble_name,
             minimum_required_realizations=config.analysis_config.minimum_required_realizations,
             ensemble_size=config.model_config.num_realizations,
@@ -182,9 +182,9 @@ def _setup_ensemble_smoother(
     return EnsembleSmoother(
         ESRunArguments(
             random_seed=config.random_seed,
-            active_realizations=_realizations(
+            active_realizations=_active_realizations(
                 args, config.model_config.num_realizations
-            ).tolist(),
+            ),
             current_case=args.current_case,
             target_case=args.target_case,
             minimum_required_realizations=config.analysis_config.minimum_required_realizations,
@@ -228,9 +228,9 @@ def _setup_multiple_data_assimilation(
     return MultipleDataAssimilation(
         ESMDARunArguments(
             random_seed=config.random_seed,
-            active_realizations=_realizations(
+            active_realizations=_active_realizations(
                 args, config.model_config.num_realizations
-            ).tolist(),
+            ),
             target_case=_iterative_case_format(config, args),
             weights=args.weights,
             restart_run=restart_run,
@@ -257,9 +257,9 @@ def _setup_iterative_ensemble_smoother(
     return IteratedEnsembleSmoother(
         SIESRunArguments(
             random_seed=config.random_seed,
-            active_realizations=_realizations(
+            active_realizations=_active_realizations(
                 args, config.model_config.num_realizations
-            ).tolist(),
+            ),
             current_case=args.current_case,
             target_case=_iterative_case_format(config, args),
             num_iterations=_num_iterations(config, args),
@@ -277,12 +277,10 @@ def _setup_iterative_ensemble_smoother(
     )
 
 
-def _realizations(args: Namespace, ensemble_size: int) -> npt.NDArray[np.bool_]:
+def _active_realizations(args: Namespace, ensemble_size: int) -> List[bool]:
     if args.realizations is None:
-        return np.ones(ensemble_size, dtype=bool)
-    return np.array(
-        ActiveRange(rangestring=args.realizations, length=ensemble_size).mask
-    )
+        return [True] * ensemble_size
+    return ActiveRange(rangestring=args.realizations, length=ensemble_size).mask
 
 
 def _iterative_case_format(config: ErtConfig, args: Namespace) -> str:
@@ -43,7 +43,6 @@
     "AnalysisModule",
     "CancelPluginException",
     "ConfigValidationError",
-    "ConfigValidationError",
     "ConfigWarning",
     "EnkfObs",
     "EnkfObservationImplementationType",
@@ -7,6 +7,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from fnmatch import fnmatch
+from functools import lru_cache
 from os import path
 from pathlib import Path
 from typing import (
@@ -67,6 +68,11 @@
 def site_config_location() -> str:
     if "ERT_SITE_CONFIG" in os.environ:
         return os.environ["ERT_SITE_CONFIG"]
+    return _default_site_config_location()
+
+
+@lru_cache(maxsize=None)
+def _default_site_config_location() -> str:
     ert_shared_loader = cast("FileLoader", pkgutil.get_loader("ert.shared"))
     return path.dirname(ert_shared_loader.get_filename()) + "/share/ert/site-config"
 
@@ -135,6 +141,8 @@ def from_file(cls, user_config_file: str) -> Self:
         Warnings will be issued with :python:`warnings.warn(category=ConfigWarning)`
         when the user should be notified with non-fatal configuration problems.
         """
+        if path.isfile(user_config_file) and not os.access(user_config_file, os.R_OK):
+            raise PermissionError(f"Permission denied: {user_config_file!r}")
         user_config_dict = ErtConfig.read_user_config(user_config_file)
         config_dir = path.abspath(path.dirname(user_config_file))
         ErtConfig._log_config_file(user_config_file)
@@ -263,31 +271,35 @@ def _log_config_file(cls, config_file: str) -> None:
         but the easy ones are filtered out.
         """
         if config_file is not None and path.isfile(config_file):
-            config_context = ""
             with open(config_file, "r", encoding="utf-8") as file_obj:
-                for line in file_obj:
-                    line = line.strip()
-                    if not line or line.startswith("--"):
-                        continue
-                    if "--" in line and not any(x in line for x in ['"', "'"]):
-                        # There might be a comment in this line, but it could
-                        # also be an argument to a job, so we do a quick check
-                        line = line.split("--")[0].rstrip()
-                    if any(
-                        kw in line
-                        for kw in [
-                            "FORWARD_MODEL",
-                            "LOAD_WORKFLOW",
-                            "LOAD_WORKFLOW_JOB",
-                            "HOOK_WORKFLOW",
-                            "WORKFLOW_JOB_DIRECTORY",
-                        ]
-                    ):
-                        continue
-                    config_context += line + "\n"
-            logger.info(
-                f"Content of the configuration file ({config_file}):\n" + config_context
-            )
+                cls._log_config_text(config_file, file_obj.read())
+
+    @classmethod
+    def _log_config_text(cls, config_file: str, config_text: str) -> None:
+        config_context = ""
+        for line in config_text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("--"):
+                continue
+            if "--" in line and not any(x in line for x in ['"', "'"]):
+                # There might be a comment in this line, but it could
+                # also be an argument to a job, so we do a quick check
+                line = line.split("--")[0].rstrip()
+            if any(
+                kw in line
+                for kw in [
+                    "FORWARD_MODEL",
+                    "LOAD_WORKFLOW",
+                    "LOAD_WORKFLOW_JOB",
+                    "HOOK_WORKFLOW",
+                    "WORKFLOW_JOB_DIRECTORY",
+                ]
+            ):
+                continue
+            config_context += line + "\n"
+        logger.info(
+            f"Content of the configuration file ({config_file}):\n" + config_context
+        )
 
     @classmethod
     def _log_config_dict(cls, content_dict: Dict[str, Any]) -> None:
@@ -462,6 +474,7 @@ def forward_model_data_to_json(
         itr: int = 0,
     ) -> Dict[str, Any]:
         context = self.substitution_list
+        real_iter_context = context.for_real_iter(iens, itr)
 
         class Substituter:
             def __init__(self, job):
@@ -475,9 +488,7 @@ def __init__(self, job):
                 )
                 self.copy_private_args = SubstitutionList()
                 for key, val in job.private_args.items():
-                    self.copy_private_args[key] = context.substitute_real_iter(
-                        val, iens, itr
-                    )
+                    self.copy_private_args[key] = real_iter_context.substitute(val)
 
             @overload
             def substitute(self, string: str) -> str: ...
@@ -491,7 +502,7 @@ def substitute(self, string):
                 string = self.copy_private_args.substitute(
                     string, self.substitution_context_hint, 1, warn_max_iter=False
                 )
-                return context.substitute_real_iter(string, iens, itr)
+                return real_iter_context.substitute(string)
 
             def filter_env_dict(self, d):
                 result = {}
@@ -831,12 +842,8 @@ def _get_files_in_directory(job_path, errors):
             )
         )
         return []
-    files = list(
-        filter(
-            path.isfile,
-            (path.abspath(path.join(job_path, f)) for f in os.listdir(job_path)),
-        )
-    )
+    with os.scandir(job_path) as entries:
+        files = [path.abspath(entry.path) for entry in entries if entry.is_file()]
 
     if files == []:
         ConfigWarning.ert_context_warn(
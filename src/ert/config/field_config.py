@@ -201,13 +201,8 @@ def load_parameters(
     ) -> Union[npt.NDArray[np.float_], xr.DataArray]:
         ds = ensemble.load_parameters(group, realizations)
         ensemble_size = len(ds.realizations)
-        da = xr.DataArray(
-            [
-                np.ma.MaskedArray(data=d, mask=self.mask).compressed()  # type: ignore
-                for d in ds["values"].values.reshape(ensemble_size, -1)
-            ]
-        )
-        return da.T.to_numpy()
+        active_index = np.flatnonzero(~self.mask)
+        return ds["values"].values.reshape(ensemble_size, -1)[:, active_index].T
 
     def _fetch_from_ensemble(
         self, real_nr: int, ensemble: LocalEnsemble
@@ -12,6 +12,8 @@ def default(self, o: Any) -> Any:
 
 
 class ContextBool:
+    __slots__ = ("val", "token", "keyword_token")
+
     def __init__(
         self, val: bool, token: FileContextToken, keyword_token: FileContextToken
     ) -> None:
@@ -49,6 +51,8 @@ def __deepcopy__(self, memo):
 
 
 class ContextFloat(float):
+    __slots__ = ("token", "keyword_token")
+
     def __new__(
         cls, val: float, token: FileContextToken, keyword_token: FileContextToken
     ) -> "ContextFloat":
@@ -65,6 +69,8 @@ def __deepcopy__(self, memo):
 
 
 class ContextString(str):
+    __slots__ = ("token", "keyword_token")
+
     @classmethod
     def from_token(cls, token: FileContextToken) -> "ContextString":
         return cls(val=str(token), token=token, keyword_token=token)
@@ -1,4 +1,4 @@
-from typing import List, cast
+from typing import Any, Dict, List, cast
 
 from lark import Token
 
@@ -27,6 +27,9 @@ def __new__(cls, token: Token, filename: str) -> "FileContextToken":
         inst_fct.filename = filename
         return inst_fct
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FileContextToken":
+        return FileContextToken(self, self.filename)
+
     def __repr__(self) -> str:
         return f"{self.value!r}"
 
@@ -1,12 +1,16 @@
 # mypy: ignore-errors
+import copy
 import datetime
 import os
 import os.path
+from functools import lru_cache
 from typing import List, Optional, Tuple, Union
 
 from lark import Discard, Lark, Token, Transformer, Tree, UnexpectedCharacters
 from typing_extensions import Self
 
+from ert.file_stamps import is_racy_stamp
+
 from .config_dict import ConfigDict
 from .config_errors import ConfigValidationError, ConfigWarning
 from .config_schema import SchemaItem, define_keyword
@@ -401,6 +405,34 @@ def _handle_includes(
 
 
 def _parse_file(file: str) -> Tree[Instruction]:
+    """Parses the file, reusing earlier results for unchanged files. The
+    same job configuration files are typically parsed every time a config
+    is loaded. The tree is copied as callers modify it."""
+    stat = os.stat(file)
+    if is_racy_stamp(stat.st_mtime_ns) or is_racy_stamp(stat.st_ctime_ns):
+        return _read_and_parse_file(file)
+    # The change time also catches permission changes and files replaced
+    # with a copy that preserves the modification time
+    return copy.deepcopy(
+        _cached_parse_file(
+            file,
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_mtime_ns,
+            stat.st_ctime_ns,
+            stat.st_size,
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_parse_file(
+    file: str, _dev: int, _ino: int, _mtime_ns: int, _ctime_ns: int, _size: int
+) -> Tree[Instruction]:
+    return _read_and_parse_file(file)
+
+
+def _read_and_parse_file(file: str) -> Tree[Instruction]:
     try:
         with open(file, encoding="utf-8") as f:
             content = f.read()
@@ -1,24 +1,47 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Tuple
 
 from fastapi import Depends
 
 from ert.dark_storage.security import security
-from ert.storage import StorageReader, open_storage
+from ert.file_stamps import is_racy_stamp
+from ert.storage import LocalEnsemble, StorageReader, open_storage
 
 __all__ = ["get_storage"]
 
 
 _storage: Optional[StorageReader] = None
+_storage_stamp: Optional[Tuple[int, ...]] = None
 
 DEFAULT_SECURITY = Depends(security)
 
 
+def _modification_stamp(path: Path) -> Tuple[int, ...]:
+    """Modification times of the parts of the storage which are read by
+    refresh(): the index and the lists of ensembles and experiments"""
+    stamp = []
+    for entry in (path / "index.json", path / "ensembles", path / "experiments"):
+        try:
+            stamp.append(entry.stat().st_mtime_ns)
+        except FileNotFoundError:
+            stamp.append(-1)
+    return tuple(stamp)
+
+
 def get_storage() -> StorageReader:
-    global _storage  # noqa: PLW0603e
+    global _storage, _storage_stamp  # noqa: PLW0603
+    path = os.environ["ERT_STORAGE_ENS_PATH"]
+    stamp = _modification_stamp(Path(path))
     if _storage is None:
-        return (_storage := open_storage(os.environ["ERT_STORAGE_ENS_PATH"]))
-    _storage.refresh()
+        _storage = open_storage(path)
+    elif stamp != _storage_stamp:
+        _storage.refresh()
+    else:
+        # Responses can be rewritten inside an existing ensemble without
+        # changing the stamp, so they must be loaded again
+        LocalEnsemble.load_responses.cache_clear()
+    _storage_stamp = None if is_racy_stamp(max(stamp)) else stamp
     return _storage
@@ -0,0 +1,11 @@
+import time
+
+# File system timestamps are coarse, so a file modified more recently than
+# this may be rewritten without its modification time changing
+RACY_STAMP_NS = 1_000_000_000
+
+
+def is_racy_stamp(mtime_ns: int) -> bool:
+    """Whether a modification time is too recent to be trusted as a sign
+    that the file has not changed since"""
+    return time.time_ns() - mtime_ns < RACY_STAMP_NS
@@ -33,36 +33,41 @@ def __init__(
         self.textChanged.connect(self.validateString)
 
         self._valid_color = self.palette().color(self.backgroundRole())
+        self._background_color = None
         self.setText(default_string)
 
         self._model.valueChanged.connect(self.modelChanged)
         self.modelChanged()
 
     def validateString(self):
-        string_to_validate = str(self.text())
-        if not string_to_validate and self.placeholderText():
-            string_to_validate = self.placeholderText()
-        if self._validator is not None:
-            status = self._validator.validate(string_to_validate)
-
-            palette = QPalette()
-            if not status:
-                palette.setColor(self.backgroundRole(), ValidationSupport.ERROR_COLOR)
-                self.setPalette(palette)
-                self._validation.setValidationMessage(
-                    str(status), ValidationSupport.EXCLAMATION
-                )
-            else:
-                palette.setColor(self.backgroundRole(), self._valid_color)
-                self.setPalette(palette)
-                self._validation.setValidationMessage("")
+        if self._validator is None:
+            return
+        string_to_validate = self.text() or self.placeholderText()
+        status = self._validator.validate(string_to_validate)
+
+        if not status:
+            self._setBackgroundColor(ValidationSupport.ERROR_COLOR)
+            self._validation.setValidationMessage(
+                str(status), ValidationSupport.EXCLAMATION
+            )
+        else:
+            self._setBackgroundColor(self._valid_color)
+            self._validation.setValidationMessage("")
+
+    def _setBackgroundColor(self, color):
+        if color == self._background_color:
+            return
+        palette = QPalette()
+        palette.setColor(self.backgroundRole(), color)
+        self.setPalette(palette)
+        self._background_color = color
 
     def emitChange(self, q_string):
         self.textChanged.emit(str(q_string))
 
     def stringBoxChanged(self):
         """Called whenever the contents of the editline changes."""
-        text = str(self.text())
+        text = self.text()
         if text == "":
             text = None
 
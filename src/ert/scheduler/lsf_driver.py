@@ -8,69 +8,62 @@
 import shutil
 from pathlib import Path
 from typing import (
+    Container,
     Dict,
     List,
     Literal,
-    Mapping,
     MutableMapping,
     Optional,
     Tuple,
-    Union,
+    cast,
     get_args,
 )
 
-from pydantic import BaseModel, Field
-from typing_extensions import Annotated
-
 from ert.scheduler.driver import Driver
 from ert.scheduler.event import Event, FinishedEvent, StartedEvent
 
+# The poll period grows by 50% for every poll in which no job changes state,
+# up to the maximum, and is reset on any change or new submission. On long
+# quiet runs this trades fewer bjobs calls for noticing a finished job up to
+# _MAX_POLL_PERIOD late.
 _POLL_PERIOD = 2.0  # seconds
+_MAX_POLL_PERIOD = 30.0  # seconds
+
+# Above this number of jobs, bjobs is asked for all jobs belonging to the
+# user and the output is filtered client side, instead of passing every
+# job id on the command line.
+_MAX_JOB_IDS_PER_BJOBS = 500
 
 logger = logging.getLogger(__name__)
 
 JobState = Literal[
     "EXIT", "DONE", "PEND", "RUN", "ZOMBI", "PDONE", "SSUSP", "USUSP", "UNKWN"
 ]
+_JOB_STATES = frozenset(get_args(JobState))
+_FINISHED_STATES = frozenset(("DONE", "EXIT"))
 
-
-class FinishedJob(BaseModel):
-    job_state: Literal["DONE", "EXIT"]
-
-
-class QueuedJob(BaseModel):
-    job_state: Literal["PEND"]
-
-
-class RunningJob(BaseModel):
-    job_state: Literal["RUN"]
-
-
-AnyJob = Annotated[
-    Union[FinishedJob, QueuedJob, RunningJob], Field(discriminator="job_state")
-]
+# Matches the JOBID and STAT columns of lines starting with a job id
+_BJOBS_LINE_RE = re.compile(r"^(\d\S*)[ \t]+\S+[ \t]+(\S+)", re.MULTILINE)
 
 LSF_INFO_JSON_FILENAME = "lsf_info.json"
 
 
-class _Stat(BaseModel):
-    jobs: Mapping[str, AnyJob]
-
-
-def parse_bjobs(bjobs_output: str) -> Dict[str, Dict[str, Dict[str, str]]]:
+def parse_bjobs(
+    bjobs_output: str, job_ids: Optional[Container[str]] = None
+) -> Dict[str, Dict[str, Dict[str, str]]]:
     data: Dict[str, Dict[str, str]] = {}
-    for line in bjobs_output.splitlines():
-        if not line or not line[0].isdigit():
+    for match in _BJOBS_LINE_RE.finditer(bjobs_output):
+        job_id, job_state = match.groups()
+        if job_ids is not None and job_id not in job_ids:
+            # bjobs -a also lists the other jobs of the user
             continue
-        tokens = line.split(maxsplit=3)
-        if len(tokens) >= 3 and tokens[0] and tokens[2]:
-            if tokens[2] not in get_args(JobState):
-                logger.error(
-                    f"Unknown state {tokens[2]} obtained from "
-                    f"LSF for jobid {tokens[0]}, ignored."
-                )
-                continue
-            data[tokens[0]] = {"job_state": tokens[2]}
+        if job_state not in _JOB_STATES:
+            logger.error(
+                f"Unknown state {job_state} obtained from "
+                f"LSF for jobid {job_id}, ignored."
+            )
+            continue
+        data[job_id] = {"job_state": job_state}
     return {"jobs": data}
 
 
@@ -95,7 +88,9 @@ def __init__(
         self._max_attempt: int = 100
         self._retry_sleep_period = 3
 
-        self._poll_period = _POLL_PERIOD
+        self._base_poll_period = _POLL_PERIOD
+        self._max_poll_period = _MAX_POLL_PERIOD
+        self._poll_period = self._base_poll_period
 
     async def submit(
         self,
@@ -128,10 +123,12 @@ async def submit(
 
         stdout_decoded = stdout.decode(errors="ignore")
 
-        match = re.search("Job <([0-9]+)> is submitted to .+ queue", stdout_decoded)
-        if match is None:
+        _, _, rest = stdout_decoded.partition("Job <")
+        job_id, _, tail = rest.partition(">")
+        if not (job_id.isascii() and job_id.isdigit()) or not tail.startswith(
+            " is submitted to "
+        ):
             raise RuntimeError(f"Could not understand '{stdout_decoded}' from bsub")
-        job_id = match[1]
         logger.info(f"Realization {iens} accepted by LSF, got id {job_id}")
 
         if runpath is not None:
@@ -140,6 +137,7 @@ async def submit(
             )
         self._jobs[job_id] = (iens, "PEND")
         self._iens2jobid[iens] = job_id
+        self._poll_period = self._base_poll_period
 
     async def kill(self, iens: int) -> None:
         if iens not in self._iens2jobid:
@@ -163,8 +161,8 @@ async def kill(self, iens: int) -> None:
             )
             return
 
-        if not re.match(
-            f"Job <{job_id}> is being terminated", stdout.decode(errors="ignore")
+        if not stdout.decode(errors="ignore").startswith(
+            f"Job <{job_id}> is being terminated"
         ):
             logger.error(
                 "LSF kill failed with stdout: "
@@ -177,11 +175,15 @@ async def kill(self, iens: int) -> None:
     async def poll(self) -> None:
         while True:
             if not self._jobs.keys():
-                await asyncio.sleep(self._poll_period)
+                await self._sleep_until_next_poll(self._poll_period)
                 continue
+            if len(self._jobs) > _MAX_JOB_IDS_PER_BJOBS:
+                bjobs_args = ["-a"]
+            else:
+                bjobs_args = list(self._jobs.keys())
             process = await asyncio.create_subprocess_exec(
                 self._bjobs_cmd,
-                *self._jobs.keys(),
+                *bjobs_args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
@@ -193,26 +195,25 @@ async def poll(self) -> None:
                 logger.warning(
                     f"bjobs gave returncode {process.returncode} and error {stderr.decode()}"
                 )
-            stat = _Stat(**parse_bjobs(stdout.decode(errors="ignore")))
-            for job_id, job in stat.jobs.items():
-                if job_id not in self._jobs:
-                    continue
-
-                iens, old_state = self._jobs[job_id]
-                new_state = job.job_state
-                if old_state == new_state:
-                    continue
-
-                self._jobs[job_id] = (iens, new_state)
+            bjobs_output = stdout.decode(errors="ignore")
+            jobs = parse_bjobs(bjobs_output, job_ids=self._jobs)["jobs"]
+            changed = {
+                job_id: job["job_state"]
+                for job_id, job in jobs.items()
+                if job_id in self._jobs and self._jobs[job_id][1] != job["job_state"]
+            }
+            for job_id, new_state in changed.items():
+                iens, _ = self._jobs[job_id]
+                self._jobs[job_id] = (iens, cast(JobState, new_state))
                 event: Optional[Event] = None
-                if isinstance(job, RunningJob):
+                if new_state == "RUN":
                     logger.debug(f"Realization {iens} is running.")
                     event = StartedEvent(iens=iens)
-                elif isinstance(job, FinishedJob):
-                    aborted = job.job_state == "EXIT"
+                elif new_state in _FINISHED_STATES:
+                    aborted = new_state == "EXIT"
                     event = FinishedEvent(
                         iens=iens,
-                        returncode=1 if job.job_state == "EXIT" else 0,
+                        returncode=1 if aborted else 0,
                         aborted=aborted,
                     )
                     if aborted:
@@ -229,12 +230,21 @@ async def poll(self) -> None:
                 if event:
                     await self.event_queue.put(event)
 
-            missing_in_bjobs_output = set(self._jobs) - set(stat.jobs.keys())
+            missing_in_bjobs_output = set(self._jobs) - jobs.keys()
             if missing_in_bjobs_output:
                 logger.warning(
                     f"bjobs did not give status for job_ids {missing_in_bjobs_output}"
                 )
-            await asyncio.sleep(_POLL_PERIOD)
+
+            if changed:
+                self._poll_period = self._base_poll_period
+            else:
+                self._poll_period = min(self._poll_period * 1.5, self._max_poll_period)
+            await self._sleep_until_next_poll(self._poll_period)
+
+    async def _sleep_until_next_poll(self, period: float) -> None:
+        """This method exists to allow for mocking it in tests"""
+        await asyncio.sleep(period)
 
     async def finish(self) -> None:
         pass
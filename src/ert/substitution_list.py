@@ -85,13 +85,20 @@ def substitute(
     def substitute_real_iter(
         self, to_substitute: str, realization: int, iteration: int
     ) -> str:
+        return self.for_real_iter(realization, iteration).substitute(to_substitute)
+
+    def for_real_iter(self, realization: int, iteration: int) -> SubstitutionList:
+        """A copy with <IENS>, <ITER> and <GEO_ID> set for the given
+        realization and iteration. Prefer this over repeated calls to
+        substitute_real_iter when substituting many strings, as each
+        of those calls copies the list."""
         copy_substituter = self.copy()
         geo_id_key = f"<GEO_ID_{realization}_{iteration}>"
         if geo_id_key in self:
             copy_substituter["<GEO_ID>"] = self[geo_id_key]
         copy_substituter["<IENS>"] = str(realization)
         copy_substituter["<ITER>"] = str(iteration)
-        return copy_substituter.substitute(to_substitute)
+        return copy_substituter
 
     def _concise_representation(self) -> str:
         return (
@@ -30,6 +30,7 @@ def get_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Mocked LSF bjobs command reading state from filesystem"
     )
+    parser.add_argument("-a", action="store_true", help="List all known jobs")
     parser.add_argument("jobs", type=str, nargs="*")
     return parser
 
@@ -56,8 +57,13 @@ def main() -> None:
 
     jobs_path = Path(os.getenv("PYTEST_TMP_PATH", ".")) / "mock_jobs"
 
+    if args.a:
+        job_ids = sorted(path.stem for path in jobs_path.glob("*.name"))
+    else:
+        job_ids = args.jobs
+
     jobs_output: List[Job] = []
-    for job in args.jobs:
+    for job in job_ids:
         name: str = read(jobs_path / f"{job}.name") or "_"
         assert name is not None
 
@@ -79,3 +79,26 @@ async def finished(iens, returncode, aborted):
 
     await driver.submit(0, f"exit {actual_returncode}")
     await poll(driver, {0}, finished=finished)
+
+
+async def test_polling_all_jobs_when_tracking_many(monkeypatch):
+    # Makes the driver run "bjobs -a" instead of listing the job ids
+    monkeypatch.setattr("ert.scheduler.lsf_driver._MAX_JOB_IDS_PER_BJOBS", 2)
+
+    # A job the driver does not know about, which must be ignored
+    bsub_process = await asyncio.create_subprocess_exec(
+        "bsub", "exit 0", stdout=asyncio.subprocess.DEVNULL
+    )
+    await bsub_process.wait()
+
+    driver = LsfDriver()
+    for iens in range(3):
+        await driver.submit(iens, "exit 0")
+
+    finished_iens = []
+
+    async def finished(iens, returncode, aborted):
+        finished_iens.append(iens)
+
+    await poll(driver, {0, 1, 2}, finished=finished)
+    assert sorted(finished_iens) == [0, 1, 2]
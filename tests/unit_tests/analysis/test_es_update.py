@@ -52,14 +52,14 @@ def obs():
     )
 
 
+_TIMESTAMP_RE = re.compile(
+    r"Time: [0-9]{4}\.[0-9]{2}\.[0-9]{2} [0-9]{2}\:[0-9]{2}\:[0-9]{2}"
+)
+
+
 def remove_timestamp_from_logfile(log_file: Path):
-    with open(log_file, "r", encoding="utf-8") as fin:
-        buf = fin.read()
-    buf = re.sub(
-        r"Time: [0-9]{4}\.[0-9]{2}\.[0-9]{2} [0-9]{2}\:[0-9]{2}\:[0-9]{2}", "Time:", buf
-    )
-    with open(log_file, "w", encoding="utf-8") as fout:
-        fout.write(buf)
+    buf = _TIMESTAMP_RE.sub("Time:", log_file.read_text(encoding="utf-8"))
+    log_file.write_text(buf, encoding="utf-8")
 
 
 @pytest.mark.parametrize("misfit_preprocess", [True, False])
@@ -257,26 +257,21 @@ def test_snapshot_alpha(alpha, expected, storage, uniform_parameter, obs):
         name="prior",
     )
     rng = np.random.default_rng(1234)
+    parameter_template = xr.Dataset(coords={"names": ["KEY_1"]})
+    response_template = xr.Dataset(coords={"index": range(3), "report_step": [0]})
     for iens in range(prior_storage.ensemble_size):
         data = rng.uniform(0, 1)
         prior_storage.save_parameters(
             "PARAMETER",
             iens,
-            xr.Dataset(
-                {
-                    "values": ("names", [data]),
-                    "transformed_values": ("names", [data]),
-                    "names": ["KEY_1"],
-                }
+            parameter_template.assign(
+                values=("names", [data]), transformed_values=("names", [data])
             ),
         )
         data = rng.uniform(0.8, 1, 3)
         prior_storage.save_response(
             "RESPONSE",
-            xr.Dataset(
-                {"values": (["report_step", "index"], [data])},
-                coords={"index": range(len(data)), "report_step": [0]},
-            ),
+            response_template.assign(values=(["report_step", "index"], [data])),
             iens,
         )
     posterior_storage = storage.create_ensemble(
@@ -332,36 +327,33 @@ def test_and_benchmark_adaptive_localization_with_fields(
         offsets=[-1, 0, 1],
         shape=(num_observations, num_parameters),
         dtype=float,
-    ).toarray()
+        format="csr",
+    )
 
     # We add some noise that is insignificant compared to the
-    # actual local structure in the forward model
-    A = A + rng.standard_normal(size=A.shape) * 0.01
+    # actual local structure in the forward model. It is kept apart from
+    # the sparse A so that no second dense copy of A is needed.
+    noise = rng.standard_normal(size=A.shape)
+    noise *= 0.01
 
     def g(X):
         """Apply the forward model."""
-        return A @ X
-
-    all_realizations = np.zeros((num_ensemble, num_grid_cells, num_grid_cells, 1))
+        return A @ X + noise @ X
 
-    # Generate num_ensemble realizations of the Gaussian Random Field
-    for i in range(num_ensemble):
-        sigma = 10
-        realization = np.exp(
+    # Generate num_ensemble realizations of the Gaussian Random Field,
+    # filtering all of them in one call by not smoothing along the first axis
+    sigma = (0, 10, 10)
+    all_realizations = np.exp(
+        gaussian_filter(
             gaussian_filter(
-                gaussian_filter(
-                    rng.standard_normal((num_grid_cells, num_grid_cells)), sigma=sigma
-                ),
+                rng.standard_normal((num_ensemble, num_grid_cells, num_grid_cells)),
                 sigma=sigma,
-            )
+            ),
+            sigma=sigma,
         )
+    )[..., np.newaxis]
 
-        realization = realization[..., np.newaxis]
-        all_realizations[i] = realization
-
-    X = all_realizations.reshape(-1, num_grid_cells * num_grid_cells).T
-
-    Y = g(X)
+    Y = g(all_realizations.reshape(num_ensemble, -1).T)
 
     # Create observations by adding noise to a realization.
     observation_noise = rng.standard_normal(size=num_observations)
@@ -423,8 +415,7 @@ def g(X):
             xr.Dataset(
                 {
                     "values": xr.DataArray(
-                        X[:, iens].reshape(num_grid_cells, num_grid_cells, 1),
-                        dims=("x", "y", "z"),
+                        all_realizations[iens], dims=("x", "y", "z")
                     ),
                 }
             ),
@@ -513,6 +504,7 @@ def test_temporary_parameter_storage_with_inactive_fields(
     """
     monkeypatch.chdir(tmp_path)
 
+    rng = np.random.default_rng(42)
     num_grid_cells = 40
     layers = 5
     ensemble_size = 5
@@ -521,7 +513,7 @@ def test_temporary_parameter_storage_with_inactive_fields(
 
     grid = xtgeo.create_box_grid(dimension=(shape.nx, shape.ny, shape.nz))
     mask = grid.get_actnum()
-    mask_list = np.random.choice([True, False], shape.nx * shape.ny * shape.nz)
+    mask_list = rng.choice([True, False], shape.nx * shape.ny * shape.nz)
     mask.values = mask_list
     grid.set_actnum(mask)
     grid.to_file("MY_EGRID.EGRID", "egrid")
@@ -550,21 +542,12 @@ def test_temporary_parameter_storage_with_inactive_fields(
         name="prior",
     )
 
-    fields = [
-        xr.Dataset(
-            {
-                "values": (
-                    ["x", "y", "z"],
-                    np.ma.MaskedArray(
-                        data=np.random.rand(shape.nx, shape.ny, shape.nz),
-                        fill_value=np.nan,
-                        mask=[~mask_list],
-                    ).filled(),
-                )
-            }
-        )
-        for _ in range(ensemble_size)
-    ]
+    inactive = ~mask_list.reshape(shape.nx, shape.ny, shape.nz)
+    fields = []
+    for _ in range(ensemble_size):
+        values = rng.random((shape.nx, shape.ny, shape.nz))
+        values[inactive] = np.nan
+        fields.append(xr.Dataset({"values": (["x", "y", "z"], values)}))
 
     for iens in range(ensemble_size):
         prior_ensemble.save_parameters(param_group, iens, fields[iens])
@@ -30,7 +30,7 @@ def test_default_realizations(poly_case):
     facade = LibresFacade(poly_case)
     args = Namespace(realizations=None)
     assert (
-        model_factory._realizations(args, facade.get_ensemble_size()).tolist()
+        model_factory._active_realizations(args, facade.get_ensemble_size())
         == [True] * facade.get_ensemble_size()
     )
 
@@ -47,7 +47,7 @@ def test_custom_realizations(poly_case):
     active_mask[4] = True
     active_mask[7] = True
     active_mask[8] = True
-    assert model_factory._realizations(args, ensemble_size).tolist() == active_mask
+    assert model_factory._active_realizations(args, ensemble_size) == active_mask
 
 
 def test_setup_single_test_run(poly_case, storage):
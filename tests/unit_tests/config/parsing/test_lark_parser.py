@@ -1,13 +1,16 @@
 import os
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
+import ert.file_stamps
 from ert.config.parsing import (
     ConfigValidationError,
     init_user_config_schema,
     lark_parse,
 )
+from ert.config.parsing.lark_parser import _cached_parse_file
 
 
 def touch(filename):
@@ -340,3 +343,42 @@ def test_that_giving_too_few_arguments_gives_config_validation_error():
 
     with pytest.raises(ConfigValidationError, match="at least 1 arguments"):
         _ = lark_parse(test_config_file_name, schema=init_user_config_schema())
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_parsed_files_are_reused_only_while_unchanged(monkeypatch):
+    monkeypatch.setattr(ert.file_stamps, "RACY_STAMP_NS", 0)
+    _cached_parse_file.cache_clear()
+    Path("include.ert").write_text("NUM_REALISATIONS 1\n", encoding="utf-8")
+    Path("config.ert").write_text("INCLUDE include.ert\n", encoding="utf-8")
+
+    config = lark_parse("config.ert", schema=init_user_config_schema())
+    assert config["NUM_REALIZATIONS"] == 1
+    assert _cached_parse_file.cache_info()[:2] == (0, 2)
+
+    config = lark_parse("config.ert", schema=init_user_config_schema())
+    assert config["NUM_REALIZATIONS"] == 1
+    assert _cached_parse_file.cache_info()[:2] == (2, 2)
+
+    # Same size and an older, but different, modification time
+    Path("include.ert").write_text("NUM_REALISATIONS 2\n", encoding="utf-8")
+    os.utime("include.ert", ns=(1, 1))
+    config = lark_parse("config.ert", schema=init_user_config_schema())
+    assert config["NUM_REALIZATIONS"] == 2
+    assert _cached_parse_file.cache_info()[:2] == (3, 3)
+
+    Path("include.ert").write_text("NUM_REALISATIONS 10\n", encoding="utf-8")
+    config = lark_parse("config.ert", schema=init_user_config_schema())
+    assert config["NUM_REALIZATIONS"] == 10
+    assert _cached_parse_file.cache_info()[:2] == (4, 4)
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_recently_modified_files_are_not_cached():
+    _cached_parse_file.cache_clear()
+    Path("config.ert").write_text("NUM_REALISATIONS 1\n", encoding="utf-8")
+
+    for _ in range(2):
+        config = lark_parse("config.ert", schema=init_user_config_schema())
+        assert config["NUM_REALIZATIONS"] == 1
+    assert _cached_parse_file.cache_info().currsize == 0
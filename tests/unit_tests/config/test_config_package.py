@@ -0,0 +1,14 @@
+import importlib
+
+import pytest
+
+import ert.config
+
+
+def test_that_all_is_free_of_duplicates():
+    assert len(ert.config.__all__) == len(set(ert.config.__all__))
+
+
+@pytest.mark.parametrize("name", ert.config.__all__)
+def test_that_all_public_names_can_be_imported(name):
+    assert getattr(importlib.import_module("ert.config"), name) is not None
@@ -1,13 +1,10 @@
-import fileinput
 import json
 import logging
 import os
 import os.path
-import stat
 from datetime import date
 from pathlib import Path
 from textwrap import dedent
-from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 from hypothesis import assume, given, settings
@@ -28,119 +25,24 @@
 
 from .config_dict_generator import config_generators
 
-config_defines = {
-    "<USER>": "TEST_USER",
-    "<SCRATCH>": "ert/model/scratch/ert",
-    "<CASE_DIR>": "the_extensive_case",
-    "<ECLIPSE_NAME>": "XYZ",
-}
-
-snake_oil_structure_config = {
-    "RUNPATH": "<SCRATCH>/<USER>/<CASE_DIR>/realization-<IENS>/iter-<ITER>",
-    "NUM_REALIZATIONS": 10,
-    "MAX_RUNTIME": 23400,
-    "MIN_REALIZATIONS": "50%",
-    "MAX_SUBMIT": 13,
-    "QUEUE_SYSTEM": "LSF",
-    "LSF_QUEUE": "mr",
-    "LSF_SERVER": "simulacrum",
-    "LSF_RESOURCE": "select[x86_64Linux] same[type:model]",
-    "MAX_RUNNING": "100",
-    "DATA_FILE": "eclipse/model/SNAKE_OIL.DATA",
-    "START": date(2017, 1, 1),
-    "SUMMARY": [
-        "WOPR:PROD",
-        "WOPT:PROD",
-        "WWPR:PROD",
-        "WWCT:PROD",
-        "WWPT:PROD",
-        "WBHP:PROD",
-        "WWIR:INJ",
-        "WWIT:INJ",
-        "WBHP:INJ",
-        "ROE:1",
-    ],
-    "GEN_KW": ["SIGMA"],
-    "GEN_DATA": ["super_data"],
-    "ECLBASE": "eclipse/model/<ECLIPSE_NAME>-<IENS>",
-    "ENSPATH": "ert/output/storage/<CASE_DIR>",
-    "UPDATE_LOG_PATH": "../output/update_log/<CASE_DIR>",
-    "RUNPATH_FILE": "ert/output/run_path_file/.ert-runpath-list_<CASE_DIR>",
-    "REFCASE": "ert/input/refcase/SNAKE_OIL_FIELD",
-    "SIGMA": {
-        "TEMPLATE": "ert/input/templates/sigma.tmpl",
-        "RESULT": "coarse.sigma",
-        "PARAMETER": "ert/input/distributions/sigma.dist",
-    },
-    "JOBNAME": "SNAKE_OIL_STRUCTURE_<IENS>",
-    "INSTALL_JOB": {
-        "SNAKE_OIL_SIMULATOR": {
-            "CONFIG": "snake_oil/jobs/SNAKE_OIL_SIMULATOR",
-            "STDOUT": "snake_oil.stdout",
-            "STDERR": "snake_oil.stderr",
-            "EXECUTABLE": "snake_oil_simulator.py",
-        },
-        "SNAKE_OIL_NPV": {
-            "CONFIG": "snake_oil/jobs/SNAKE_OIL_NPV",
-            "STDOUT": "snake_oil_npv.stdout",
-            "STDERR": "snake_oil_npv.stderr",
-            "EXECUTABLE": "snake_oil_npv.py",
-        },
-        "SNAKE_OIL_DIFF": {
-            "CONFIG": "snake_oil/jobs/SNAKE_OIL_DIFF",
-            "STDOUT": "snake_oil_diff.stdout",
-            "STDERR": "snake_oil_diff.stderr",
-            "EXECUTABLE": "snake_oil_diff.py",
-        },
-    },
-    "FORWARD_MODEL": ["SNAKE_OIL_SIMULATOR", "SNAKE_OIL_NPV", "SNAKE_OIL_DIFF"],
-    "HISTORY_SOURCE": "REFCASE_HISTORY",
-    "OBS_CONFIG": "ert/input/observations/obsfiles/observations.txt",
-    "LOAD_WORKFLOW": [["ert/bin/workflows/MAGIC_PRINT", "MAGIC_PRINT"]],
-    "LOAD_WORKFLOW_JOB": [
-        ["ert/bin/workflows/workflowjobs/bin/uber_print.py", "UBER_PRINT"],
-    ],
-    "GRID": "eclipse/include/grid/CASE.EGRID",
-    "RUN_TEMPLATE": {
-        "seed_template": {
-            "TEMPLATE_FILE": "ert/input/templates/seed_template.txt",
-            "TARGET_FILE": "seed.txt",
-        }
-    },
-}
-
-
-def expand_config_defs(defines, config):
-    for define_key, define_value in defines.items():
-        for data_key, data_value in config.items():
-            if isinstance(data_value, str):
-                config[data_key] = data_value.replace(define_key, define_value)
-
-
-# Expand all strings in snake oil structure config according to defines.
-expand_config_defs(config_defines, snake_oil_structure_config)
-
-
-def test_include_existing_file(tmpdir):
-    with tmpdir.as_cwd():
-        config = """
-        JOBNAME my_name%d
-        INCLUDE include_me
-        NUM_REALIZATIONS 1
-        """
-        rand_seed = 420
-        include_me_text = f"""
-        RANDOM_SEED {rand_seed}
-        """
 
-        with open("config.ert", mode="w", encoding="utf-8") as fh:
-            fh.writelines(config)
+@pytest.mark.usefixtures("use_tmpdir")
+def test_include_existing_file():
+    config = """
+    JOBNAME my_name%d
+    INCLUDE include_me
+    NUM_REALIZATIONS 1
+    """
+    rand_seed = 420
+    include_me_text = f"""
+    RANDOM_SEED {rand_seed}
+    """
 
-        with open("include_me", mode="w", encoding="utf-8") as fh:
-            fh.writelines(include_me_text)
+    Path("config.ert").write_text(config, encoding="utf-8")
+    Path("include_me").write_text(include_me_text, encoding="utf-8")
 
-        ert_config = ErtConfig.from_file("config.ert")
-        assert ert_config.random_seed == rand_seed
+    ert_config = ErtConfig.from_file("config.ert")
+    assert ert_config.random_seed == rand_seed
 
 
 def test_init(minimum_case):
@@ -172,15 +74,13 @@ def test_runpath_file(monkeypatch, tmp_path):
     workdir_path.mkdir(parents=True)
     monkeypatch.chdir(workdir_path)
 
-    with config_path.open("w") as f:
-        f.writelines(
-            [
-                "DEFINE <FOO> foo\n",
-                "RUNPATH_FILE ../output/my_custom_runpath_path.<FOO>\n",
-                # Required for this to be a valid ErtConfig
-                "NUM_REALIZATIONS 1\n",
-            ]
-        )
+    config_path.write_text(
+        "DEFINE <FOO> foo\n"
+        "RUNPATH_FILE ../output/my_custom_runpath_path.<FOO>\n"
+        # Required for this to be a valid ErtConfig
+        "NUM_REALIZATIONS 1\n",
+        encoding="utf-8",
+    )
 
     config = ErtConfig.from_file(os.path.relpath(config_path, workdir_path))
     assert config.runpath_file == runpath_path
@@ -195,8 +95,7 @@ def test_that_job_script_can_be_set_in_site_config(monkeypatch, tmp_path):
     test_site_config = tmp_path / "test_site_config.ert"
     my_script = (tmp_path / "my_script").resolve()
     my_script.write_text("")
-    st = os.stat(my_script)
-    os.chmod(my_script, st.st_mode | stat.S_IEXEC)
+    my_script.chmod(0o755)
     test_site_config.write_text(
         f"JOB_SCRIPT job_dispatch.py\nJOB_SCRIPT {my_script}\nQUEUE_SYSTEM LOCAL\n"
     )
@@ -214,6 +113,14 @@ def test_that_job_script_can_be_set_in_site_config(monkeypatch, tmp_path):
     assert Path(ert_config.queue_config.job_script).resolve() == my_script
 
 
+@pytest.fixture(scope="module")
+def executable_script(tmp_path_factory):
+    my_script = (tmp_path_factory.mktemp("script") / "my_script").resolve()
+    my_script.write_text("")
+    my_script.chmod(0o755)
+    return my_script
+
+
 @pytest.mark.parametrize(
     "run_mode",
     [
@@ -224,16 +131,12 @@ def test_that_job_script_can_be_set_in_site_config(monkeypatch, tmp_path):
         HookRuntime.POST_UPDATE,
     ],
 )
-def test_that_workflow_run_modes_can_be_selected(tmp_path, run_mode):
-    my_script = (tmp_path / "my_script").resolve()
-    my_script.write_text("")
-    st = os.stat(my_script)
-    os.chmod(my_script, st.st_mode | stat.S_IEXEC)
+def test_that_workflow_run_modes_can_be_selected(tmp_path, run_mode, executable_script):
     test_user_config = tmp_path / "user_config.ert"
     test_user_config.write_text(
         "JOBNAME  Job%d\nRUNPATH /tmp/simulations/realization-<IENS>/iter-<ITER>\n"
         "NUM_REALIZATIONS 10\n"
-        f"LOAD_WORKFLOW {my_script} SCRIPT\n"
+        f"LOAD_WORKFLOW {executable_script} SCRIPT\n"
         f"HOOK_WORKFLOW SCRIPT {run_mode.name}\n"
     )
     ert_config = ErtConfig.from_file(str(test_user_config))
@@ -254,10 +157,8 @@ def test_logging_config(caplog, config_content, expected):
     base_content = "Content of the configuration file (file_name):\n{}"
     config_path = "file_name"
 
-    with patch("builtins.open", mock_open(read_data=config_content)), patch(
-        "os.path.isfile", MagicMock(return_value=True)
-    ), caplog.at_level(logging.INFO):
-        ErtConfig._log_config_file(config_path)
+    with caplog.at_level(logging.INFO):
+        ErtConfig._log_config_text(config_path, config_content)
     expected = base_content.format(expected)
     assert expected in caplog.messages
 
@@ -277,8 +178,7 @@ def test_logging_with_comments(caplog):
     SUMMARY *
     """
     )
-    with open("config.ert", "w", encoding="utf-8") as fh:
-        fh.writelines(config)
+    Path("config.ert").write_text(config, encoding="utf-8")
     with caplog.at_level(logging.INFO):
         ErtConfig._log_config_file("config.ert")
     assert (
@@ -286,7 +186,7 @@ def test_logging_with_comments(caplog):
 NUM_REALIZATIONS 1
 ECLBASE PRED_RUN
 SUMMARY *"""
-        in caplog.text
+        in caplog.messages[-1]
     )
 
 
@@ -328,17 +228,15 @@ def test_that_parsing_workflows_gives_expected():
         ert_file.write("HOOK_WORKFLOW no_print PRE_UPDATE\n")
 
     os.mkdir("workflows")
-
-    with open("workflows/MAGIC_PRINT", "w", encoding="utf-8") as f:
-        f.write("print_uber\n")
-    with open("workflows/NO_PRINT", "w", encoding="utf-8") as f:
-        f.write("print_uber\n")
-    with open("workflows/SOME_PRINT", "w", encoding="utf-8") as f:
-        f.write("print_uber\n")
-    with open("workflows/UBER_PRINT", "w", encoding="utf-8") as f:
-        f.write("EXECUTABLE ls\n")
-    with open("workflows/HIDDEN_PRINT", "w", encoding="utf-8") as f:
-        f.write("EXECUTABLE ls\n")
+    workflow_files = {
+        "workflows/MAGIC_PRINT": "print_uber\n",
+        "workflows/NO_PRINT": "print_uber\n",
+        "workflows/SOME_PRINT": "print_uber\n",
+        "workflows/UBER_PRINT": "EXECUTABLE ls\n",
+        "workflows/HIDDEN_PRINT": "EXECUTABLE ls\n",
+    }
+    for file_name, content in workflow_files.items():
+        Path(file_name).write_text(content, encoding="utf-8")
 
     ert_config = ErtConfig.from_dict(config_dict)
 
@@ -374,43 +272,41 @@ def test_that_get_plugin_jobs_fetches_exactly_ert_plugins():
 
     script_file_path = os.path.join(os.getcwd(), "script")
     plugin_file_path = os.path.join(os.getcwd(), "plugin")
-    with open(script_file_path, mode="w", encoding="utf-8") as fh:
-        fh.write(script_file_contents)
-    with open(plugin_file_path, mode="w", encoding="utf-8") as fh:
-        fh.write(plugin_file_contents)
-
-    with open("script.py", mode="w", encoding="utf-8") as fh:
-        fh.write(
-            dedent(
-                """
-                from ert import ErtScript
-                class Script(ErtScript):
-                    def run(self, *args):
-                        pass
-                """
-            )
-        )
-    with open("plugin.py", mode="w", encoding="utf-8") as fh:
-        fh.write(
-            dedent(
-                """
-                from ert.config import ErtPlugin
-                class Plugin(ErtPlugin):
-                    def run(self, *args):
-                        pass
-                """
-            )
-        )
-    with open("config.ert", mode="w", encoding="utf-8") as fh:
-        fh.write(
-            dedent(
-                f"""
-                NUM_REALIZATIONS 1
-                LOAD_WORKFLOW_JOB {plugin_file_path} plugin
-                LOAD_WORKFLOW_JOB {script_file_path} script
-                """
-            )
-        )
+    Path(script_file_path).write_text(script_file_contents, encoding="utf-8")
+    Path(plugin_file_path).write_text(plugin_file_contents, encoding="utf-8")
+
+    Path("script.py").write_text(
+        dedent(
+            """
+            from ert import ErtScript
+            class Script(ErtScript):
+                def run(self, *args):
+                    pass
+            """
+        ),
+        encoding="utf-8",
+    )
+    Path("plugin.py").write_text(
+        dedent(
+            """
+            from ert.config import ErtPlugin
+            class Plugin(ErtPlugin):
+                def run(self, *args):
+                    pass
+            """
+        ),
+        encoding="utf-8",
+    )
+    Path("config.ert").write_text(
+        dedent(
+            f"""
+            NUM_REALIZATIONS 1
+            LOAD_WORKFLOW_JOB {plugin_file_path} plugin
+            LOAD_WORKFLOW_JOB {script_file_path} script
+            """
+        ),
+        encoding="utf-8",
+    )
 
     ert_config = ErtConfig.from_file("config.ert")
 
@@ -418,48 +314,48 @@ def run(self, *args):
     assert not ert_config.workflow_jobs["script"].is_plugin()
 
 
-def test_data_file_with_non_utf_8_character_gives_error_message(tmpdir):
-    with tmpdir.as_cwd():
-        data_file = "data_file.DATA"
-        with open("config.ert", mode="w", encoding="utf-8") as fh:
-            fh.write(
-                """NUM_REALIZATIONS 1
-            DATA_FILE data_file.DATA
-            ECLBASE data_file_<ITER>
+@pytest.mark.usefixtures("use_tmpdir")
+def test_data_file_with_non_utf_8_character_gives_error_message(tmp_path):
+    data_file = "data_file.DATA"
+    Path("config.ert").write_text(
+        """NUM_REALIZATIONS 1
+        DATA_FILE data_file.DATA
+        ECLBASE data_file_<ITER>
+        """,
+        encoding="utf-8",
+    )
+    Path(data_file).write_text(
+        dedent(
             """
-            )
-        with open(data_file, mode="w", encoding="utf-8") as fh:
-            fh.write(
-                dedent(
-                    """
-                        START
-                        --  DAY   MONTH  YEAR
-                        1    'JAN'  2017   /
-                    """
-                )
-            )
-        with open(data_file, "ab") as f:
-            f.write(b"\xff")
-        data_file_path = f"{tmpdir}/{data_file}"
-        with pytest.raises(
-            ConfigValidationError,
-            match="Unsupported non UTF-8 character "
-            f"'ÿ' found in file: {data_file_path!r}",
-        ):
-            ErtConfig.from_file("config.ert")
+                START
+                --  DAY   MONTH  YEAR
+                1    'JAN'  2017   /
+            """
+        ),
+        encoding="utf-8",
+    )
+    with open(data_file, "ab") as f:
+        f.write(b"\xff")
+    data_file_path = str(tmp_path / data_file)
+    with pytest.raises(
+        ConfigValidationError,
+        match="Unsupported non UTF-8 character "
+        f"'ÿ' found in file: {data_file_path!r}",
+    ):
+        ErtConfig.from_file("config.ert")
 
 
-def test_that_double_comments_are_handled(tmpdir):
-    with tmpdir.as_cwd():
-        with open("config.ert", mode="w", encoding="utf-8") as fh:
-            fh.write(
-                """NUM_REALIZATIONS 1 -- foo -- bar -- 2
-                   JOBNAME &SUM$VAR@12@#£¤<
-            """
-            )
-        ert_config = ErtConfig.from_file("config.ert")
-        assert ert_config.model_config.num_realizations == 1
-        assert ert_config.model_config.jobname_format_string == "&SUM$VAR@12@#£¤<"
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_double_comments_are_handled():
+    Path("config.ert").write_text(
+        """NUM_REALIZATIONS 1 -- foo -- bar -- 2
+               JOBNAME &SUM$VAR@12@#£¤<
+        """,
+        encoding="utf-8",
+    )
+    ert_config = ErtConfig.from_file("config.ert")
+    assert ert_config.model_config.num_realizations == 1
+    assert ert_config.model_config.jobname_format_string == "&SUM$VAR@12@#£¤<"
 
 
 @pytest.mark.filterwarnings("ignore:.*Unknown keyword.*:ert.config.ConfigWarning")
@@ -481,8 +377,7 @@ def test_ert_config_parses_date():
         ENSPATH <STORAGE>/ensemble
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     ert_config = ErtConfig.from_file(test_config_file_name)
 
     date_string = date.today().isoformat()
@@ -498,36 +393,31 @@ def test_that_subst_list_is_given_default_runpath_file():
     test_config_file_base = "test"
     test_config_file_name = f"{test_config_file_base}.ert"
     test_config_contents = "NUM_REALIZATIONS 1"
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert ert_config.substitution_list["<RUNPATH_FILE>"] == os.path.abspath(
         ErtConfig.DEFAULT_RUNPATH_FILE
     )
 
 
-@pytest.mark.usefixtures("set_site_config")
-@settings(max_examples=10)
-@given(config_generators())
-def test_that_creating_ert_config_from_dict_is_same_as_from_file(
-    tmp_path_factory, config_generator
-):
-    filename = "config.ert"
-    with config_generator(tmp_path_factory, filename) as config_values:
-        assert ErtConfig.from_dict(
-            config_values.to_config_dict("config.ert", os.getcwd())
-        ) == ErtConfig.from_file(filename)
-
-
 @pytest.mark.usefixtures("set_site_config")
 @settings(max_examples=10)
 @given(config_generators())
 def test_that_parsing_ert_config_result_in_expected_values(
     tmp_path_factory, config_generator
 ):
+    """
+    Checks both that from_dict gives the same ErtConfig as from_file and
+    that the parsed values are the generated ones, so that each generated
+    config is only written and parsed once.
+    """
     filename = "config.ert"
     with config_generator(tmp_path_factory, filename) as config_values:
+        from_dict = ErtConfig.from_dict(
+            config_values.to_config_dict("config.ert", os.getcwd())
+        )
         ert_config = ErtConfig.from_file(filename)
+        assert from_dict == ert_config
         assert ert_config.ens_path == config_values.enspath
         assert ert_config.random_seed == config_values.random_seed
         assert ert_config.queue_config.max_submit == config_values.max_submit
@@ -542,40 +432,40 @@ def test_that_parsing_ert_config_result_in_expected_values(
         )
 
 
-def test_default_ens_path(tmpdir):
-    with tmpdir.as_cwd():
-        config_file = "test.ert"
-        with open(config_file, "w", encoding="utf-8") as f:
-            f.write(
-                """
+@pytest.mark.usefixtures("use_tmpdir")
+def test_default_ens_path():
+    config_file = "test.ert"
+    Path(config_file).write_text(
+        """
 NUM_REALIZATIONS  1
+        """,
+        encoding="utf-8",
+    )
+    ert_config = ErtConfig.from_file(config_file)
+    # By default, the ensemble path is set to 'storage'
+    default_ens_path = ert_config.ens_path
+
+    with open(config_file, "a", encoding="utf-8") as f:
+        f.write(
             """
-            )
-        ert_config = ErtConfig.from_file(config_file)
-        # By default, the ensemble path is set to 'storage'
-        default_ens_path = ert_config.ens_path
-
-        with open(config_file, "a", encoding="utf-8") as f:
-            f.write(
-                """
 ENSPATH storage
-            """
-            )
+        """
+        )
 
-        # Set the ENSPATH in the config file
-        ert_config = ErtConfig.from_file(config_file)
-        set_in_file_ens_path = ert_config.ens_path
+    # Set the ENSPATH in the config file
+    ert_config = ErtConfig.from_file(config_file)
+    set_in_file_ens_path = ert_config.ens_path
 
-        assert default_ens_path == set_in_file_ens_path
+    assert default_ens_path == set_in_file_ens_path
 
-        config_dict = {
-            ConfigKeys.NUM_REALIZATIONS: 1,
-            "ENSPATH": os.path.join(os.getcwd(), "storage"),
-        }
+    config_dict = {
+        ConfigKeys.NUM_REALIZATIONS: 1,
+        "ENSPATH": os.path.join(os.getcwd(), "storage"),
+    }
 
-        dict_set_ens_path = ErtConfig.from_dict(config_dict).ens_path
+    dict_set_ens_path = ErtConfig.from_dict(config_dict).ens_path
 
-        assert dict_set_ens_path == config_dict["ENSPATH"]
+    assert dict_set_ens_path == config_dict["ENSPATH"]
 
 
 @pytest.mark.usefixtures("use_tmpdir")
@@ -600,8 +490,7 @@ def test_queue_config_max_running_invalid_values(max_running_value, expected_err
         QUEUE_OPTION LOCAL MAX_RUNNING {max_running_value}
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     if expected_error:
         with pytest.raises(
             expected_exception=ConfigValidationError,
@@ -612,8 +501,23 @@ def test_queue_config_max_running_invalid_values(max_running_value, expected_err
         ErtConfig.from_file(test_config_file_name)
 
 
+torque_base_config = dedent(
+    """
+    NUM_REALIZATIONS 1
+    DEFINE <STORAGE> storage/<CONFIG_FILE_BASE>-<DATE>
+    RUNPATH <STORAGE>/runpath/realization-<IENS>/iter-<ITER>
+    ENSPATH <STORAGE>/ensemble
+    QUEUE_SYSTEM TORQUE
+    """
+)
+
+
 @pytest.mark.usefixtures("use_tmpdir")
-@given(st.integers(min_value=0), st.integers(min_value=0), st.integers(min_value=0))
+@given(
+    st.integers(min_value=0, max_value=4),
+    st.integers(min_value=0, max_value=4),
+    st.integers(min_value=0, max_value=4),
+)
 def test_num_cpu_vs_torque_queue_cpu_configuration(
     num_cpu_int, num_nodes_int, num_cpus_per_node_int
 ):
@@ -632,15 +536,7 @@ def test_num_cpu_vs_torque_queue_cpu_configuration(
 
     test_config_file_base = "test"
     test_config_file_name = f"{test_config_file_base}.ert"
-    test_config_contents = dedent(
-        """
-        NUM_REALIZATIONS 1
-        DEFINE <STORAGE> storage/<CONFIG_FILE_BASE>-<DATE>
-        RUNPATH <STORAGE>/runpath/realization-<IENS>/iter-<ITER>
-        ENSPATH <STORAGE>/ensemble
-        QUEUE_SYSTEM TORQUE
-        """
-    )
+    test_config_contents = torque_base_config
     if num_cpu:
         test_config_contents += f"NUM_CPU {num_cpu}\n"
     if num_nodes:
@@ -650,8 +546,7 @@ def test_num_cpu_vs_torque_queue_cpu_configuration(
             f"QUEUE_OPTION TORQUE NUM_CPUS_PER_NODE {num_cpus_per_node}\n"
         )
 
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     if expected_error:
         with pytest.raises(
             expected_exception=ConfigValidationError,
@@ -675,8 +570,7 @@ def test_that_non_existant_job_directory_gives_config_validation_error():
         INSTALL_JOB_DIRECTORY does_not_exist
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     with pytest.raises(
         expected_exception=ConfigValidationError,
         match="Unable to locate job directory",
@@ -698,8 +592,7 @@ def test_that_empty_job_directory_gives_warning():
         """
     )
     os.mkdir("empty")
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     with pytest.warns(ConfigWarning, match="No files found in job directory"):
         _ = ErtConfig.from_file(test_config_file_name)
 
@@ -715,8 +608,7 @@ def test_that_recursive_define_warns_when_early_liveness_detection_mechanism_tri
         RUNPATH runpath/realization-<IENS>/iter-<ITER>/<A>
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     with pytest.warns(
         ConfigWarning,
         match="Gave up replacing in runpath/realization-<IENS>/iter-<ITER>/<A>."
@@ -739,8 +631,7 @@ def test_that_recursive_define_warns_when_reached_max_iterations():
         RUNPATH runpath/realization-<IENS>/iter-<ITER>/<A>
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     with pytest.warns(
         ConfigWarning,
         match="Gave up replacing in runpath/realization-<IENS>/iter-<ITER>/<A>.\n"
@@ -753,36 +644,17 @@ def test_that_recursive_define_warns_when_reached_max_iterations():
 
 
 @pytest.mark.usefixtures("use_tmpdir")
-def test_that_loading_non_existant_workflow_gives_validation_error():
+@pytest.mark.parametrize("keyword", ["LOAD_WORKFLOW", "LOAD_WORKFLOW_JOB"])
+def test_that_loading_non_existant_workflow_gives_validation_error(keyword):
     test_config_file_base = "test"
     test_config_file_name = f"{test_config_file_base}.ert"
     test_config_contents = dedent(
-        """
-        NUM_REALIZATIONS  1
-        LOAD_WORKFLOW does_not_exist
-        """
-    )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
-    with pytest.raises(
-        expected_exception=ConfigValidationError,
-        match='Cannot find file or directory "does_not_exist"',
-    ):
-        ErtConfig.from_file(test_config_file_name)
-
-
-@pytest.mark.usefixtures("use_tmpdir")
-def test_that_loading_non_existant_workflow_job_gives_validation_error():
-    test_config_file_base = "test"
-    test_config_file_name = f"{test_config_file_base}.ert"
-    test_config_contents = dedent(
-        """
+        f"""
         NUM_REALIZATIONS  1
-        LOAD_WORKFLOW_JOB does_not_exist
+        {keyword} does_not_exist
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     with pytest.raises(
         expected_exception=ConfigValidationError,
         match='Cannot find file or directory "does_not_exist"',
@@ -801,12 +673,9 @@ def test_that_job_definition_file_with_unexecutable_script_gives_validation_erro
         LOAD_WORKFLOW_JOB {job_name}
         """
     )
-    with open(job_name, "w", encoding="utf-8") as fh:
-        fh.write(f"EXECUTABLE {job_script_file}\n")
-    with open(job_script_file, "w", encoding="utf-8") as fh:
-        fh.write("#!/bin/sh\n")
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(job_name).write_text(f"EXECUTABLE {job_script_file}\n", encoding="utf-8")
+    Path(job_script_file).write_text("#!/bin/sh\n", encoding="utf-8")
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
     with pytest.raises(
         expected_exception=ConfigValidationError,
     ):
@@ -823,8 +692,7 @@ def test_char_in_unquoted_is_allowed(c):
         RUNPATH path{c}a/b
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert f"path{c}a/b" in ert_config.model_config.runpath_format_string
@@ -846,33 +714,31 @@ def test_that_magic_strings_get_substituted_in_workflow():
     )
     script_file_path = os.path.join(os.getcwd(), "script")
     workflow_file_path = os.path.join(os.getcwd(), "workflow")
-    with open(script_file_path, mode="w", encoding="utf-8") as fh:
-        fh.write(script_file_contents)
-    with open(workflow_file_path, mode="w", encoding="utf-8") as fh:
-        fh.write(workflow_file_contents)
-
-    with open("script.py", mode="w", encoding="utf-8") as fh:
-        fh.write(
-            dedent(
-                """
-                from ert import ErtScript
-                class Script(ErtScript):
-                    def run(self, *args):
-                        pass
-                """
-            )
-        )
-    with open("config.ert", mode="w", encoding="utf-8") as fh:
-        fh.write(
-            dedent(
-                f"""
-                NUM_REALIZATIONS 1
-                DEFINE <ZERO> 0
-                LOAD_WORKFLOW_JOB {script_file_path} script
-                LOAD_WORKFLOW {workflow_file_path}
-                """
-            )
-        )
+    Path(script_file_path).write_text(script_file_contents, encoding="utf-8")
+    Path(workflow_file_path).write_text(workflow_file_contents, encoding="utf-8")
+
+    Path("script.py").write_text(
+        dedent(
+            """
+            from ert import ErtScript
+            class Script(ErtScript):
+                def run(self, *args):
+                    pass
+            """
+        ),
+        encoding="utf-8",
+    )
+    Path("config.ert").write_text(
+        dedent(
+            f"""
+            NUM_REALIZATIONS 1
+            DEFINE <ZERO> 0
+            LOAD_WORKFLOW_JOB {script_file_path} script
+            LOAD_WORKFLOW {workflow_file_path}
+            """
+        ),
+        encoding="utf-8",
+    )
 
     ert_config = ErtConfig.from_file("config.ert")
 
@@ -888,8 +754,7 @@ def test_that_unknown_job_gives_config_validation_error():
         SIMULATION_JOB NO_SUCH_JOB
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     with pytest.raises(ConfigValidationError, match="Could not find job 'NO_SUCH_JOB'"):
         _ = ErtConfig.from_file(test_config_file_name)
@@ -904,8 +769,7 @@ def test_that_unknown_hooked_job_gives_config_validation_error():
         HOOK_WORKFLOW NO_SUCH_JOB PRE_SIMULATION
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     with pytest.raises(
         ConfigValidationError,
@@ -940,8 +804,7 @@ def test_that_include_statements_with_multiple_values_raises_error():
         INCLUDE this and that and some-other
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     with pytest.raises(
         ConfigValidationError, match="Keyword:INCLUDE must have exactly one argument"
@@ -973,8 +836,7 @@ def test_that_workflows_with_errors_are_not_loaded():
         """
     )
 
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     with pytest.warns(
         ConfigWarning,
@@ -1022,8 +884,7 @@ def test_that_adding_a_workflow_twice_warns():
         """
     )
 
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     with pytest.warns(
         ConfigWarning,
@@ -1058,8 +919,7 @@ def test_that_failing_to_load_ert_script_with_errors_fails_gracefully(load_state
         """
     )
 
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     with pytest.warns(
         ConfigWarning, match="Loading workflow job.*failed.*It will not be loaded."
@@ -1077,8 +937,7 @@ def test_that_define_statements_with_less_than_one_argument_raises_error():
         DEFINE <USER>
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     with pytest.raises(
         ConfigValidationError,
@@ -1097,8 +956,7 @@ def test_that_define_statements_with_more_than_one_argument():
         DEFINE <TEST2> <TEST1> 444 555
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert ert_config.substitution_list.get("<TEST1>") == "111 222 333"
@@ -1120,10 +978,8 @@ def test_that_include_statements_work():
         JOBNAME included
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
-    with open(test_include_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_include_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
+    Path(test_include_file_name).write_text(test_include_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert ert_config.model_config.jobname_format_string == "included"
@@ -1138,8 +994,7 @@ def test_that_define_string_quotes_are_removed():
         NUM_REALIZATIONS 1
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     ert_Config = ErtConfig.from_file(test_config_file_name)
     assert ert_Config.substitution_list.get("<A>") == "A"
@@ -1167,12 +1022,9 @@ def test_that_included_files_uses_paths_relative_to_itself():
         EXECUTABLE echo
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
-    with open(test_include_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_include_contents)
-    with open(test_fm_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_fm_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
+    Path(test_include_file_name).write_text(test_include_contents, encoding="utf-8")
+    Path(test_fm_file_name).write_text(test_fm_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert ert_config.installed_jobs["FM"].name == "FM"
@@ -1188,8 +1040,7 @@ def test_that_boolean_values_can_be_any_case(val, expected):
         STOP_LONG_RUNNING {val}
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert ert_config.analysis_config.stop_long_running == expected
@@ -1220,10 +1071,8 @@ def test_that_include_take_into_account_path():
     os.mkdir("dir")
     Path("dir/job1").write_text("EXECUTABLE echo\n", encoding="utf-8")
     Path("job2").write_text("EXECUTABLE ls\n", encoding="utf-8")
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
-    with open(test_include_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_include_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
+    Path(test_include_file_name).write_text(test_include_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert list(ert_config.installed_jobs.keys()) == [
@@ -1250,10 +1099,8 @@ def test_that_substitution_happens_for_include():
     )
     # The old parser tries to find dir/job2
     os.mkdir("dir")
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
-    with open(test_include_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_include_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
+    Path(test_include_file_name).write_text(test_include_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert (
@@ -1280,10 +1127,8 @@ def test_that_defines_in_included_files_has_immediate_effect():
     )
     # The old parser tries to find dir/job2
     os.mkdir("dir")
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
-    with open(test_include_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_include_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
+    Path(test_include_file_name).write_text(test_include_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(test_config_file_name)
     assert "baz-<ITER>-<IENS>" in ert_config.model_config.runpath_format_string
@@ -1299,8 +1144,7 @@ def test_that_multiple_errors_are_shown_for_forward_model():
         FORWARD_MODEL does_not_exist2
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     with pytest.raises(ConfigValidationError) as err:
         _ = ErtConfig.from_file(test_config_file_name)
@@ -1336,8 +1180,7 @@ def test_that_redefines_work_with_setenv():
         SETENV VAR2 <X>
     """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
+    Path(test_config_file_name).write_text(test_config_contents, encoding="utf-8")
 
     ert_config = ErtConfig.from_file(user_config_file=test_config_file_name)
 
@@ -1360,33 +1203,31 @@ def test_parsing_workflow_with_multiple_args():
     )
     script_file_path = os.path.join(os.getcwd(), "script")
     workflow_file_path = os.path.join(os.getcwd(), "workflow")
-    with open(script_file_path, mode="w", encoding="utf-8") as fh:
-        fh.write(script_file_contents)
-    with open(workflow_file_path, mode="w", encoding="utf-8") as fh:
-        fh.write(workflow_file_contents)
-
-    with open("script.py", mode="w", encoding="utf-8") as fh:
-        fh.write(
-            dedent(
-                """
-                from ert import ErtScript
-                class Script(ErtScript):
-                    def run(self, *args):
-                        pass
-                """
-            )
-        )
-    with open("config.ert", mode="w", encoding="utf-8") as fh:
-        fh.write(
-            dedent(
-                f"""
-                NUM_REALIZATIONS 1
-                DEFINE <ZERO> 0
-                LOAD_WORKFLOW_JOB {script_file_path} script
-                LOAD_WORKFLOW {workflow_file_path}
-                """
-            )
-        )
+    Path(script_file_path).write_text(script_file_contents, encoding="utf-8")
+    Path(workflow_file_path).write_text(workflow_file_contents, encoding="utf-8")
+
+    Path("script.py").write_text(
+        dedent(
+            """
+            from ert import ErtScript
+            class Script(ErtScript):
+                def run(self, *args):
+                    pass
+            """
+        ),
+        encoding="utf-8",
+    )
+    Path("config.ert").write_text(
+        dedent(
+            f"""
+            NUM_REALIZATIONS 1
+            DEFINE <ZERO> 0
+            LOAD_WORKFLOW_JOB {script_file_path} script
+            LOAD_WORKFLOW {workflow_file_path}
+            """
+        ),
+        encoding="utf-8",
+    )
 
     ert_config = ErtConfig.from_file("config.ert")
 
@@ -1397,16 +1238,17 @@ def run(self, *args):
 def test_validate_job_args_no_warning(caplog, recwarn):
     caplog.set_level(logging.WARNING)
 
-    with open("job_file", "w", encoding="utf-8") as fout:
-        fout.write("EXECUTABLE echo\nARGLIST <ECLBASE> <RUNPATH>\n")
+    Path("job_file").write_text(
+        "EXECUTABLE echo\nARGLIST <ECLBASE> <RUNPATH>\n", encoding="utf-8"
+    )
 
-    with open("config_file.ert", "w", encoding="utf-8") as fout:
-        # Write a minimal config file
-        fout.write("NUM_REALIZATIONS 1\n")
-        fout.write("INSTALL_JOB job_name job_file\n")
-        fout.write(
-            "FORWARD_MODEL job_name(<ECLBASE>=A/<ECLBASE>, <RUNPATH>=<RUNPATH>/x)\n"
-        )
+    # Write a minimal config file
+    Path("config_file.ert").write_text(
+        "NUM_REALIZATIONS 1\n"
+        "INSTALL_JOB job_name job_file\n"
+        "FORWARD_MODEL job_name(<ECLBASE>=A/<ECLBASE>, <RUNPATH>=<RUNPATH>/x)\n",
+        encoding="utf-8",
+    )
 
     ErtConfig.from_file("config_file.ert")
 
@@ -1419,16 +1261,19 @@ def test_validate_job_args_no_warning(caplog, recwarn):
 
 @pytest.mark.usefixtures("use_tmpdir")
 def test_validate_no_logs_when_overwriting_with_same_value(caplog):
-    with open("job_file", "w", encoding="utf-8") as fout:
-        fout.write("EXECUTABLE echo\nARGLIST <VAR1> <VAR2> <VAR3>\n")
+    Path("job_file").write_text(
+        "EXECUTABLE echo\nARGLIST <VAR1> <VAR2> <VAR3>\n", encoding="utf-8"
+    )
 
-    with open("config_file.ert", "w", encoding="utf-8") as fout:
-        fout.write("NUM_REALIZATIONS 1\n")
-        fout.write("DEFINE <VAR1> 10\n")
-        fout.write("DEFINE <VAR2> 20\n")
-        fout.write("DEFINE <VAR3> 55\n")
-        fout.write("INSTALL_JOB job_name job_file\n")
-        fout.write("FORWARD_MODEL job_name(<VAR1>=10, <VAR2>=<VAR2>, <VAR3>=5)\n")
+    Path("config_file.ert").write_text(
+        "NUM_REALIZATIONS 1\n"
+        "DEFINE <VAR1> 10\n"
+        "DEFINE <VAR2> 20\n"
+        "DEFINE <VAR3> 55\n"
+        "INSTALL_JOB job_name job_file\n"
+        "FORWARD_MODEL job_name(<VAR1>=10, <VAR2>=<VAR2>, <VAR3>=5)\n",
+        encoding="utf-8",
+    )
 
     with caplog.at_level(logging.INFO):
         ert_conf = ErtConfig.from_file("config_file.ert")
@@ -1465,12 +1310,10 @@ def test_that_removed_analysis_module_keywords_raises_error(
         NUM_REALIZATIONS  1
         """
     )
-    with open(test_config_file_name, "w", encoding="utf-8") as fh:
-        fh.write(test_config_contents)
-        obsolete_keyword = (
-            "ANALYSIS_SET_VAR STD_ENKF " + obsolete_analysis_keyword + " 1"
-        )
-        fh.write(obsolete_keyword)
+    obsolete_keyword = "ANALYSIS_SET_VAR STD_ENKF " + obsolete_analysis_keyword + " 1"
+    Path(test_config_file_name).write_text(
+        test_config_contents + obsolete_keyword, encoding="utf-8"
+    )
 
     with pytest.raises(
         ConfigValidationError,
@@ -1525,20 +1368,23 @@ def test_that_context_types_are_json_serializable():
 
 @pytest.mark.usefixtures("copy_snake_oil_case")
 def test_no_timemap_or_refcase_provides_clear_error():
+    config = Path("snake_oil.ert")
+    lines = config.read_text(encoding="utf-8").splitlines(keepends=True)
+    config.write_text(
+        "".join(
+            line for line in lines if not line.startswith(("REFCASE", "TIME_MAP"))
+        ),
+        encoding="utf-8",
+    )
 
-    with fileinput.input("snake_oil.ert", inplace=True) as fin:
-        for line in fin:
-            if line.startswith("REFCASE"):
-                continue
-            if line.startswith("TIME_MAP"):
-                continue
-            print(line, end="")
-
-    with fileinput.input("observations/observations.txt", inplace=True) as fin:
-        for line in fin:
-            if line.startswith("HISTORY_OBSERVATION"):
-                continue
-            print(line, end="")
+    observations = Path("observations/observations.txt")
+    lines = observations.read_text(encoding="utf-8").splitlines(keepends=True)
+    observations.write_text(
+        "".join(
+            line for line in lines if not line.startswith("HISTORY_OBSERVATION")
+        ),
+        encoding="utf-8",
+    )
 
     with pytest.raises(
         ObservationConfigError,
@@ -1549,11 +1395,16 @@ def test_no_timemap_or_refcase_provides_clear_error():
 
 @pytest.mark.usefixtures("copy_snake_oil_case")
 def test_that_multiple_errors_are_shown_when_validating_observation_config():
-    with fileinput.input("observations/observations.txt", inplace=True) as fin:
-        for line_number, line in enumerate(fin, 1):
-            if line_number in [13, 32]:
-                continue
-            print(line, end="")
+    observations = Path("observations/observations.txt")
+    lines = observations.read_text(encoding="utf-8").splitlines(keepends=True)
+    observations.write_text(
+        "".join(
+            line
+            for line_number, line in enumerate(lines, 1)
+            if line_number not in {13, 32}
+        ),
+        encoding="utf-8",
+    )
 
     with pytest.raises(ObservationConfigError) as err:
         _ = ErtConfig.from_file("snake_oil.ert")
@@ -1575,12 +1426,11 @@ def test_that_multiple_errors_are_shown_when_generating_observations():
         31: "    DATE    = 2009-12-15;",
         39: "    DATE    = 2010-12-10;",
     }
-    with fileinput.input("observations/observations.txt", inplace=True) as fin:
-        for line_number, line in enumerate(fin, 1):
-            if line_number in injected_errors:
-                print(injected_errors[line_number])
-                continue
-            print(line, end="")
+    observations = Path("observations/observations.txt")
+    lines = observations.read_text(encoding="utf-8").splitlines(keepends=True)
+    for line_number, error in injected_errors.items():
+        lines[line_number - 1] = error + "\n"
+    observations.write_text("".join(lines), encoding="utf-8")
 
     with pytest.raises(ObservationConfigError) as err:
         _ = ErtConfig.from_file("snake_oil.ert")
@@ -1,7 +1,9 @@
 import os
 from pathlib import Path
 
+import numpy as np
 import pytest
+import xarray as xr
 import xtgeo
 
 from ert.config import ConfigValidationError, ConfigWarning, FieldConfig
@@ -212,3 +214,44 @@ def test_invalid_argument_gives_a_user_error_message(
         _ = parse_field_line(
             f"FIELD f parameter out.roff INIT_FILES:file.init {invalid_argument}"
         )
+
+
+def test_load_parameters_gives_the_active_cells_of_a_masked_field(tmp_path, storage):
+    shape = Shape(4, 3, 2)
+    rng = np.random.default_rng(42)
+    grid = xtgeo.create_box_grid(dimension=(shape.nx, shape.ny, shape.nz))
+    actnum = grid.get_actnum()
+    actnum.values = rng.choice([True, False], shape.nx * shape.ny * shape.nz)
+    grid.set_actnum(actnum)
+    grid.to_file(tmp_path / "MY_EGRID.EGRID", "egrid")
+    field = FieldConfig.from_config_list(
+        str(tmp_path / "MY_EGRID.EGRID"),
+        shape,
+        ["f", "f", "f.roff", "INIT_FILES:f%d.grdecl", "FORWARD_INIT:False"],
+    )
+    experiment = storage.create_experiment(parameters=[field])
+    ensemble = storage.create_ensemble(experiment, name="prior", ensemble_size=3)
+    assert field.mask.any()
+    assert not field.mask.all()
+
+    values = rng.random((3, shape.nx, shape.ny, shape.nz))
+    for iens, realization_values in enumerate(values):
+        ensemble.save_parameters(
+            "f",
+            iens,
+            xr.Dataset({"values": (["x", "y", "z"], realization_values)}),
+        )
+
+    loaded = field.load_parameters(ensemble, "f", np.arange(3))
+    assert loaded.shape == (np.count_nonzero(~field.mask), 3)
+    for iens, realization_values in enumerate(values):
+        np.testing.assert_array_equal(
+            loaded[:, iens],
+            np.ma.MaskedArray(data=realization_values, mask=field.mask).compressed(),
+        )
+
+    for iens in range(3):
+        field.save_parameters(ensemble, "f", iens, loaded[:, iens])
+    np.testing.assert_array_equal(
+        field.load_parameters(ensemble, "f", np.arange(3)), loaded
+    )
@@ -1,11 +1,18 @@
 import io
 import json
+import os
+import shutil
+from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
+import xarray as xr
 from numpy.testing import assert_array_equal
 from requests import Response
 
+from ert import file_stamps
+from ert.dark_storage import enkf
+
 
 def test_get_experiment(poly_example_tmp_dir, dark_storage_client):
     resp: Response = dark_storage_client.get("/experiments")
@@ -236,3 +243,50 @@ def test_get_coeffs_records(poly_example_tmp_dir, dark_storage_client, coeffs):
     assert all(dataframe.index.values == [1, 2, 4])
     assert dataframe.index.name == "Realization"
     assert dataframe.shape == tuple([3, 1])
+
+
+def test_storage_is_only_refreshed_when_modified(
+    poly_example_tmp_dir, dark_storage_client, monkeypatch
+):
+    monkeypatch.setattr(file_stamps, "RACY_STAMP_NS", 0)
+    dark_storage_client.get("/experiments")
+    refresh = MagicMock()
+    monkeypatch.setattr(enkf._storage, "refresh", refresh)
+
+    dark_storage_client.get("/experiments")
+    refresh.assert_not_called()
+
+    index_stat = os.stat("storage/index.json")
+    os.utime(
+        "storage/index.json",
+        ns=(index_stat.st_atime_ns, index_stat.st_mtime_ns + 1_000_000_000),
+    )
+    dark_storage_client.get("/experiments")
+    refresh.assert_called_once()
+
+
+def test_that_responses_rewritten_in_an_existing_ensemble_are_served(
+    poly_example_tmp_dir_shared, tmp_path, dark_storage_client, monkeypatch
+):
+    shutil.copytree(poly_example_tmp_dir_shared, tmp_path / "poly_example")
+    monkeypatch.chdir(tmp_path / "poly_example")
+    monkeypatch.setattr(file_stamps, "RACY_STAMP_NS", 0)
+    resp: Response = dark_storage_client.get("/experiments")
+    ensemble_id = resp.json()[0]["ensemble_ids"][0]
+
+    def get_poly_res():
+        resp: Response = dark_storage_client.get(
+            f"/ensembles/{ensemble_id}/responses/POLY_RES@0/data"
+        )
+        stream = io.BytesIO(resp.content)
+        return pd.read_csv(stream, index_col=0, float_precision="round_trip")
+
+    before = get_poly_res()
+    response_file = f"storage/ensembles/{ensemble_id}/realization-1/POLY_RES.nc"
+    with xr.open_dataset(response_file, engine="scipy") as dataset:
+        rewritten = dataset.load() + 1000.0
+    rewritten.to_netcdf(response_file, engine="scipy")
+    after = get_poly_res()
+
+    assert_array_equal(after.drop(index=1), before.drop(index=1))
+    assert list(after.loc[1]) == pytest.approx(list(before.loc[1] + 1000.0))
@@ -1,11 +1,9 @@
 import contextlib
-import copy
-import fileinput
 import os
 import os.path
 import shutil
 import stat
-import time
+import threading
 from datetime import datetime as dt
 from textwrap import dedent
 from typing import List, Type, TypeVar
@@ -18,6 +16,7 @@
 
 from ert.config import ErtConfig
 from ert.enkf_main import EnKFMain
+from ert.ensemble_evaluator.event import EndEvent
 from ert.ensemble_evaluator.snapshot import (
     ForwardModel,
     RealizationSnapshot,
@@ -56,31 +55,40 @@ def handle_manage_dialog():
         cases_panel = get_child(dialog, CaseInitializationConfigurationPanel)
         callback(dialog, cases_panel)
 
-    QTimer.singleShot(1000, handle_manage_dialog)
+    QTimer.singleShot(0, handle_manage_dialog)
     manage_tool = gui.tools["Manage cases"]
     manage_tool.trigger()
 
 
+@pytest.fixture(scope="session")
+def prepared_poly_dir(source_root, tmp_path_factory):
+    """The poly_example test data with a reduced number of realizations.
+    It is prepared once, and the main window fixtures work on copies of it."""
+    poly_dir = tmp_path_factory.mktemp("poly-prepared") / "test_data"
+    shutil.copytree(os.path.join(source_root, "test-data", "poly_example"), poly_dir)
+    poly_config = poly_dir / "poly.ert"
+    lines = poly_config.read_text(encoding="utf-8").splitlines(keepends=True)
+    poly_config.write_text(
+        "".join(
+            # Decrease the number of realizations to speed up the test,
+            # if there is flakyness, this can be increased.
+            "NUM_REALIZATIONS 20\n" if "NUM_REALIZATIONS" in line else line
+            for line in lines
+        ),
+        encoding="utf-8",
+    )
+    return poly_dir
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.fixture(name="opened_main_window", scope="module")
-def opened_main_window_fixture(source_root, tmpdir_factory) -> ErtMainWindow:
+def opened_main_window_fixture(prepared_poly_dir, tmpdir_factory) -> ErtMainWindow:
     with pytest.MonkeyPatch.context() as mp:
         tmp_path = tmpdir_factory.mktemp("test-data")
-        shutil.copytree(
-            os.path.join(source_root, "test-data", "poly_example"),
-            tmp_path / "test_data",
-        )
+        shutil.copytree(prepared_poly_dir, tmp_path / "test_data")
         mp.chdir(tmp_path / "test_data")
-        with fileinput.input("poly.ert", inplace=True) as fin:
-            for line in fin:
-                if "NUM_REALIZATIONS" in line:
-                    # Decrease the number of realizations to speed up the test,
-                    # if there is flakyness, this can be increased.
-                    print("NUM_REALIZATIONS 20", end="\n")
-                else:
-                    print(line, end="")
-            config = ErtConfig.from_file("poly.ert")
-            poly_case = EnKFMain(config)
+        config = ErtConfig.from_file("poly.ert")
+        poly_case = EnKFMain(config)
         args_mock = Mock()
         args_mock.config = "poly.ert"
 
@@ -102,23 +110,11 @@ def opened_main_window_fixture(source_root, tmpdir_factory) -> ErtMainWindow:
 
 
 @pytest.fixture
-def opened_main_window_clean(source_root, tmpdir):
+def opened_main_window_clean(prepared_poly_dir, tmpdir):
     with pytest.MonkeyPatch.context() as mp:
-        shutil.copytree(
-            os.path.join(source_root, "test-data", "poly_example"),
-            tmpdir / "test_data",
-        )
+        shutil.copytree(prepared_poly_dir, tmpdir / "test_data")
         mp.chdir(tmpdir / "test_data")
 
-        with fileinput.input("poly.ert", inplace=True) as fin:
-            for line in fin:
-                if "NUM_REALIZATIONS" in line:
-                    # Decrease the number of realizations to speed up the test,
-                    # if there is flakyness, this can be increased.
-                    print("NUM_REALIZATIONS 20", end="\n")
-                else:
-                    print(line, end="")
-
         poly_case = EnKFMain(ErtConfig.from_file("poly.ert"))
         args_mock = Mock()
         args_mock.config = "poly.ert"
@@ -140,8 +136,9 @@ def esmda_has_run(run_experiment):
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.fixture(name="run_experiment", scope="module")
 def run_experiment_fixture(request, opened_main_window):
+    qtbot = QtBot(request)
+
     def func(experiment_mode):
-        qtbot = QtBot(request)
         gui = opened_main_window
         with contextlib.suppress(FileNotFoundError):
             shutil.rmtree("poly_out")
@@ -165,7 +162,7 @@ def handle_dialog():
             )
 
         if not experiment_mode.name() in ("Ensemble experiment", "Evaluate ensemble"):
-            QTimer.singleShot(500, handle_dialog)
+            QTimer.singleShot(0, handle_dialog)
         qtbot.mouseClick(start_simulation, Qt.LeftButton)
 
         # The Run dialog opens, click show details and wait until done appears
@@ -240,13 +237,14 @@ def _evaluate(coeffs, x):
 
 @pytest.fixture()
 def full_snapshot() -> Snapshot:
+    now = dt.now()
     real = RealizationSnapshot(
         status=REALIZATION_STATE_UNKNOWN,
         active=True,
         forward_models={
             "0": ForwardModel(
-                start_time=dt.now(),
-                end_time=dt.now(),
+                start_time=now,
+                end_time=now,
                 name="poly_eval",
                 index="0",
                 status=FORWARD_MODEL_STATE_START,
@@ -257,8 +255,8 @@ def full_snapshot() -> Snapshot:
                 max_memory_usage="312",
             ),
             "1": ForwardModel(
-                start_time=dt.now(),
-                end_time=dt.now(),
+                start_time=now,
+                end_time=now,
                 name="poly_postval",
                 index="1",
                 status=FORWARD_MODEL_STATE_START,
@@ -269,7 +267,7 @@ def full_snapshot() -> Snapshot:
                 max_memory_usage="312",
             ),
             "2": ForwardModel(
-                start_time=dt.now(),
+                start_time=now,
                 end_time=None,
                 name="poly_post_mortem",
                 index="2",
@@ -282,12 +280,12 @@ def full_snapshot() -> Snapshot:
             ),
         },
     )
+    # model_dump gives every realization its own dicts, so the realizations
+    # can share the same RealizationSnapshot here without being copied
     snapshot = SnapshotDict(
         status=ENSEMBLE_STATE_STARTED,
-        reals={},
+        reals={str(i): real for i in range(0, 100)},
     )
-    for i in range(0, 100):
-        snapshot.reals[str(i)] = copy.deepcopy(real)
 
     return Snapshot(snapshot.model_dump())
 
@@ -295,6 +293,8 @@ def full_snapshot() -> Snapshot:
 @pytest.fixture()
 def large_snapshot() -> Snapshot:
     builder = SnapshotBuilder()
+    start_time = dt(1999, 1, 1).isoformat()
+    end_time = dt(2019, 1, 1).isoformat()
     for i in range(0, 150):
         builder.add_forward_model(
             forward_model_id=str(i),
@@ -305,8 +305,8 @@ def large_snapshot() -> Snapshot:
             status=FORWARD_MODEL_STATE_START,
             stdout=f"job_{i}.stdout",
             stderr=f"job_{i}.stderr",
-            start_time=dt(1999, 1, 1).isoformat(),
-            end_time=dt(2019, 1, 1).isoformat(),
+            start_time=start_time,
+            end_time=end_time,
         )
     real_ids = [str(i) for i in range(0, 150)]
     return builder.build(real_ids, REALIZATION_STATE_UNKNOWN)
@@ -315,6 +315,8 @@ def large_snapshot() -> Snapshot:
 @pytest.fixture()
 def small_snapshot() -> Snapshot:
     builder = SnapshotBuilder()
+    start_time = dt(1999, 1, 1).isoformat()
+    end_time = dt(2019, 1, 1).isoformat()
     for i in range(0, 2):
         builder.add_forward_model(
             forward_model_id=str(i),
@@ -325,8 +327,8 @@ def small_snapshot() -> Snapshot:
             status=FORWARD_MODEL_STATE_START,
             stdout=f"job_{i}.stdout",
             stderr=f"job_{i}.stderr",
-            start_time=dt(1999, 1, 1).isoformat(),
-            end_time=dt(2019, 1, 1).isoformat(),
+            start_time=start_time,
+            end_time=end_time,
         )
     real_ids = [str(i) for i in range(0, 5)]
     return builder.build(real_ids, REALIZATION_STATE_UNKNOWN)
@@ -353,28 +355,31 @@ def runmodel(active_realizations) -> Mock:
 
 
 class MockTracker:
-    def __init__(self, events) -> None:
+    def __init__(self, events, wait_for_termination: bool = False) -> None:
         self._events = events
-        self._is_running = True
+        self._wait_for_termination = wait_for_termination
+        self._terminated = threading.Event()
 
     def track(self):
         for event in self._events:
-            if not self._is_running:
+            if self._wait_for_termination and isinstance(event, EndEvent):
+                # Keep the experiment running until it is killed
+                self._terminated.wait()
+            if self._terminated.is_set():
                 break
-            time.sleep(0.1)
             yield event
 
     def reset(self):
         pass
 
     def request_termination(self):
-        self._is_running = False
+        self._terminated.set()
 
 
 @pytest.fixture
 def mock_tracker():
-    def _make_mock_tracker(events):
-        return MockTracker(events)
+    def _make_mock_tracker(events, wait_for_termination: bool = False):
+        return MockTracker(events, wait_for_termination)
 
     return _make_mock_tracker
 
@@ -394,17 +399,20 @@ def handle_load_results_dialog():
 
         # Verify that the messagebox is the success kind
         def handle_popup_dialog():
+            qtbot.waitUntil(
+                lambda: isinstance(QApplication.activeModalWidget(), QMessageBox)
+            )
             messagebox = QApplication.activeModalWidget()
             assert isinstance(messagebox, QMessageBox)
             assert messagebox.text() == "Successfully loaded all realisations"
             ok_button = messagebox.button(QMessageBox.Ok)
             qtbot.mouseClick(ok_button, Qt.LeftButton)
 
-        QTimer.singleShot(2000, handle_popup_dialog)
+        QTimer.singleShot(0, handle_popup_dialog)
         qtbot.mouseClick(load_button, Qt.LeftButton)
         dialog.close()
 
-    QTimer.singleShot(1000, handle_load_results_dialog)
+    QTimer.singleShot(0, handle_load_results_dialog)
     load_results_tool = gui.tools["Load results manually"]
     load_results_tool.trigger()
 
@@ -427,7 +435,7 @@ def handle_add_dialog():
 
             qtbot.mouseClick(dialog._ok_button, Qt.MouseButton.LeftButton)
 
-        QTimer.singleShot(1000, handle_add_dialog)
+        QTimer.singleShot(0, handle_add_dialog)
         qtbot.mouseClick(add_widget.addButton, Qt.MouseButton.LeftButton)
 
         dialog.close()
@@ -47,7 +47,9 @@ def test_kill_simulations(runmodel, qtbot: QtBot, mock_tracker):
     qtbot.addWidget(widget)
 
     with patch("ert.gui.simulation.run_dialog.EvaluatorTracker") as tracker:
-        tracker.return_value = mock_tracker([EndEvent(failed=False, failed_msg="")])
+        tracker.return_value = mock_tracker(
+            [EndEvent(failed=False, failed_msg="")], wait_for_termination=True
+        )
         widget.startSimulation()
 
     with qtbot.waitSignal(widget.finished, timeout=30000):
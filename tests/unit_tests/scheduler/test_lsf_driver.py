@@ -3,7 +3,7 @@
 import stat
 from contextlib import ExitStack as does_not_raise
 from pathlib import Path
-from typing import Collection, get_args
+from typing import Awaitable, Callable, Collection, List, Optional, get_args
 
 import pytest
 from hypothesis import given
@@ -333,3 +333,150 @@ async def test_faulty_bjobs(monkeypatch, tmp_path, bjobs_script, expectation):
     with expectation:
         await driver.submit(0, "sleep")
         await asyncio.wait_for(poll(driver, {0}), timeout=0.2)
+
+
+@pytest.fixture
+def lsf_bin_path(monkeypatch, tmp_path):
+    """Puts a bsub handing out increasing job ids first in PATH; bjobs is
+    written by each test"""
+    monkeypatch.chdir(tmp_path)
+    bin_path = tmp_path / "bin"
+    bin_path.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_path}:{os.environ['PATH']}")
+    bsub_path = bin_path / "bsub"
+    bsub_path.write_text(
+        "#!/bin/sh\n"
+        "job_id=$(($(cat last_job_id 2>/dev/null || echo 0) + 1))\n"
+        "echo $job_id > last_job_id\n"
+        "echo \"Job <$job_id> is submitted to default queue\"",
+        encoding="utf-8",
+    )
+    bsub_path.chmod(bsub_path.stat().st_mode | stat.S_IEXEC)
+    return bin_path
+
+
+def write_bjobs(bin_path: Path, script: str) -> None:
+    bjobs_path = bin_path / "bjobs"
+    bjobs_path.write_text(f"#!/bin/sh\n{script}", encoding="utf-8")
+    bjobs_path.chmod(bjobs_path.stat().st_mode | stat.S_IEXEC)
+
+
+class _StopPolling(Exception):
+    pass
+
+
+async def poll_sleeps(
+    monkeypatch,
+    driver: LsfDriver,
+    count: int,
+    on_sleep: Optional[Callable[[int], Awaitable[None]]] = None,
+) -> List[float]:
+    """Runs driver.poll() until it has slept 'count' times and returns the
+    requested sleep periods. The sleeps return immediately, and 'on_sleep'
+    is awaited with the number of each sleep before it returns."""
+    sleeps: List[float] = []
+
+    async def recording_sleep(period: float) -> None:
+        sleeps.append(period)
+        if len(sleeps) == count:
+            raise _StopPolling
+        if on_sleep is not None:
+            await on_sleep(len(sleeps))
+
+    with monkeypatch.context() as m:
+        m.setattr(driver, "_sleep_until_next_poll", recording_sleep)
+        with pytest.raises(_StopPolling):
+            await driver.poll()
+    return sleeps
+
+
+async def test_poll_period_backs_off_up_to_max_when_no_state_changes(
+    monkeypatch, lsf_bin_path
+):
+    write_bjobs(lsf_bin_path, f"echo '{BJOBS_HEADER}\n1 someuser PEND foo'")
+    driver = LsfDriver()
+    driver._base_poll_period = 2.0
+    driver._max_poll_period = 10.0
+    await driver.submit(0, "sleep")
+
+    sleeps = await poll_sleeps(monkeypatch, driver, count=6)
+
+    assert sleeps == [3.0, 4.5, 6.75, 10.0, 10.0, 10.0]
+
+
+async def test_poll_period_is_reset_on_state_change(monkeypatch, lsf_bin_path):
+    Path("job_state").write_text("PEND", encoding="utf-8")
+    write_bjobs(
+        lsf_bin_path, f"echo '{BJOBS_HEADER}'; echo \"1 someuser $(cat job_state) foo\""
+    )
+    driver = LsfDriver()
+    driver._base_poll_period = 2.0
+    await driver.submit(0, "sleep")
+
+    async def start_job(sleep_number: int) -> None:
+        if sleep_number == 3:
+            Path("job_state").write_text("RUN", encoding="utf-8")
+
+    sleeps = await poll_sleeps(monkeypatch, driver, count=5, on_sleep=start_job)
+
+    assert sleeps == [3.0, 4.5, 6.75, 2.0, 3.0]
+
+
+async def test_poll_period_is_reset_on_submit(monkeypatch, lsf_bin_path):
+    write_bjobs(
+        lsf_bin_path,
+        f"echo '{BJOBS_HEADER}\n1 someuser PEND foo\n2 someuser PEND foo'",
+    )
+    driver = LsfDriver()
+    driver._base_poll_period = 2.0
+    await driver.submit(0, "sleep")
+
+    async def submit_another(sleep_number: int) -> None:
+        if sleep_number == 3:
+            await driver.submit(1, "sleep")
+
+    sleeps = await poll_sleeps(monkeypatch, driver, count=5, on_sleep=submit_another)
+
+    assert sleeps == [3.0, 4.5, 6.75, 3.0, 4.5]
+
+
+async def test_that_bjobs_asks_for_all_jobs_when_there_are_many(
+    monkeypatch, lsf_bin_path
+):
+    monkeypatch.setattr("ert.scheduler.lsf_driver._MAX_JOB_IDS_PER_BJOBS", 2)
+    write_bjobs(
+        lsf_bin_path,
+        'echo "$@" > captured_bjobs_args\n'
+        f"echo '{BJOBS_HEADER}'\n"
+        "for job_id in 1 2 3 4; do echo \"$job_id someuser DONE foo\"; done",
+    )
+    driver = LsfDriver()
+    for iens in range(3):
+        await driver.submit(iens, "sleep")
+
+    finished_iens: List[int] = []
+
+    async def finished(iens: int, returncode: int, aborted: bool) -> None:
+        finished_iens.append(iens)
+
+    await asyncio.wait_for(poll(driver, {0, 1, 2}, finished=finished), timeout=5)
+
+    assert Path("captured_bjobs_args").read_text(encoding="utf-8").strip() == "-a"
+    # Job id 4 belongs to some other job of the user, and is ignored
+    assert sorted(finished_iens) == [0, 1, 2]
+
+
+async def test_that_unknown_states_of_other_jobs_are_not_logged(
+    monkeypatch, lsf_bin_path, caplog
+):
+    monkeypatch.setattr("ert.scheduler.lsf_driver._MAX_JOB_IDS_PER_BJOBS", 0)
+    write_bjobs(
+        lsf_bin_path,
+        f"echo '{BJOBS_HEADER}\n1 someuser DONE foo\n2 someuser PSUSP foo'",
+    )
+    driver = LsfDriver()
+    await driver.submit(0, "sleep")
+
+    await asyncio.wait_for(poll(driver, {0}), timeout=5)
+
+    assert "Unknown state" not in caplog.text
@@ -3,6 +3,7 @@
 import random
 import shutil
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -35,8 +36,7 @@ def create_jobs_json(realization: Realization) -> None:
     }
     realization_run_path = Path(realization.run_arg.runpath)
     realization_run_path.mkdir()
-    with open(realization_run_path / "jobs.json", mode="w", encoding="utf-8") as f:
-        json.dump(jobs, f)
+    (realization_run_path / "jobs.json").write_text(json.dumps(jobs), encoding="utf-8")
 
 
 @pytest.fixture
@@ -45,6 +45,11 @@ def realization(storage, tmp_path):
     return create_stub_realization(ensemble, tmp_path, 0)
 
 
+@lru_cache(maxsize=None)
+def _job_dispatch_script() -> str:
+    return str(shutil.which("job_dispatch.py"))
+
+
 def create_stub_realization(ensemble, base_path: Path, iens) -> Realization:
     run_arg = RunArg(
         run_id="",
@@ -62,7 +67,7 @@ def create_stub_realization(ensemble, base_path: Path, iens) -> Realization:
         max_runtime=None,
         run_arg=run_arg,
         num_cpu=1,
-        job_script=str(shutil.which("job_dispatch.py")),
+        job_script=_job_dispatch_script(),
     )
     return realization
 
@@ -150,8 +155,9 @@ async def test_add_dispatch_information_to_jobs_file(
     sch.add_dispatch_information_to_jobs_file()
 
     for realization in realizations:
-        job_file_path = Path(realization.run_arg.runpath) / "jobs.json"
-        cert_file_path = Path(realization.run_arg.runpath) / CERT_FILE
+        runpath = Path(realization.run_arg.runpath)
+        job_file_path = runpath / "jobs.json"
+        cert_file_path = runpath / CERT_FILE
         content: dict = json.loads(job_file_path.read_text(encoding="utf-8"))
         assert content["ens_id"] == test_ens_id
         assert content["real_id"] == realization.iens
@@ -214,7 +220,7 @@ async def wait():
 
     timeouteventfound = False
     while not timeouteventfound and not sch._events.empty():
-        event = await sch._events.get()
+        event = sch._events.get_nowait()
         if from_json(event)["type"] == "com.equinor.ert.realization.timeout":
             timeouteventfound = True
     assert timeouteventfound
@@ -245,13 +251,15 @@ async def wait():
 
 @pytest.mark.parametrize("max_running", [0, 1, 2, 10])
 async def test_max_running(max_running, mock_driver, storage, tmp_path):
-    runs: List[bool] = []
+    currently_running = 0
+    max_running_observed = 0
 
     async def wait():
-        nonlocal runs
-        runs.append(True)
+        nonlocal currently_running, max_running_observed
+        currently_running += 1
+        max_running_observed = max(max_running_observed, currently_running)
         await asyncio.sleep(0.01)
-        runs.append(False)
+        currently_running -= 1
 
     # Ensemble size must be larger than max_running to be able
     # to expose issues related to max_running
@@ -271,12 +279,6 @@ async def wait():
 
     assert await sch.execute() == EVTYPE_ENSEMBLE_STOPPED
 
-    currently_running = 0
-    max_running_observed = 0
-    for run in runs:
-        currently_running += 1 if run else -1
-        max_running_observed = max(max_running_observed, currently_running)
-
     if max_running > 0:
         assert max_running_observed == max_running
     else:
@@ -314,7 +316,7 @@ async def kill():
 
     timeouteventfound = False
     while not timeouteventfound and not sch._events.empty():
-        event = await sch._events.get()
+        event = sch._events.get_nowait()
         if from_json(event)["type"] == "com.equinor.ert.realization.timeout":
             timeouteventfound = True
 
@@ -397,7 +399,7 @@ async def test_submit_sleep(
 
     async def wait():
         nonlocal run_start_times
-        run_start_times.append(time.time())
+        run_start_times.append(time.monotonic())
         await asyncio.sleep(realization_runtime)
 
     ensemble_size = 10
@@ -439,7 +441,7 @@ async def test_submit_sleep_with_max_running(
 
     async def wait():
         nonlocal run_start_times
-        run_start_times.append(time.time())
+        run_start_times.append(time.monotonic())
         # If the realization runtimes are constant, we will never get into
         # the situation where we can start many realizations at the same moment
         runtime = realization_max_runtime * random.random()
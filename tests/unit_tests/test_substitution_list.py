@@ -28,3 +28,14 @@ def test_substitution_list():
     assert subst_list.get("nosuchkey") is None
     assert subst_list.get(513) is None
     assert subst_list == {"<Key>": "Value", "<Key2>": "Value2"}
+
+
+def test_for_real_iter_does_not_modify_the_original_list():
+    subst_list = SubstitutionList()
+    subst_list["<GEO_ID_2_1>"] = "geo"
+
+    real_iter_list = subst_list.for_real_iter(2, 1)
+
+    assert real_iter_list.substitute("<IENS>-<ITER>-<GEO_ID>") == "2-1-geo"
+    assert subst_list.substitute_real_iter("<IENS>-<ITER>-<GEO_ID>", 2, 1) == "2-1-geo"
+    assert subst_list == {"<GEO_ID_2_1>": "geo"}
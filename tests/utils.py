@@ -37,16 +37,18 @@ def source_dir() -> Path:
 def wait_until(func, interval=0.5, timeout=30):
     """Waits until func returns True.
 
-    Repeatedly calls 'func' until it returns true.
-    Waits 'interval' seconds before each invocation. If 'timeout' is
-    reached, will raise the AssertionError.
+    Repeatedly calls 'func' until it returns true. The wait between
+    invocations starts at 10 ms and grows until it reaches 'interval'
+    seconds. If 'timeout' is reached, will raise the AssertionError.
     """
-    t = 0
-    while t < timeout:
-        time.sleep(interval)
+    delay = min(0.01, interval)
+    elapsed = 0.0
+    while elapsed < timeout:
         if func():
             return
-        t += interval
+        time.sleep(delay)
+        elapsed += delay
+        delay = min(delay * 1.5, interval)
     raise AssertionError(
         "Timeout reached in wait_until "
         f"(function {func.__name__}, timeout {timeout:g})."